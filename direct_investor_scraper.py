@@ -17,18 +17,22 @@ if project_root not in sys.path:
 # Import existing SNC scraper components (reuse everything!)
 from services.scrapers.snc.snc_scraper_service import SNCVCScraper
 from services.scrapers.snc.helpers.session_manager import SessionManager
+from services.scrapers.snc.helpers.log_utils import get_logger
+from services.scrapers.snc.helpers.url_utils import vc_id_from_url
 
 # Import new investor data manager
 from services.scrapers.snc.investors_finder.investor_data_manager import InvestorDataManager
 
+logger = get_logger(__name__)
+
 
 def run_direct_investor_session():
     """
     Direct investor scraping session - replaces page-based approach
     Uses existing components with investor database approach
     """
-    print("🎯 SNC SCRAPER - DIRECT INVESTOR SESSION")
-    print("=" * 50)
+    logger.info("🎯 SNC SCRAPER - DIRECT INVESTOR SESSION")
+    logger.info("=" * 50)
 
     # Create scraper with user configuration (same as existing)
     scraper = SNCVCScraper(verbose=True, use_config=True)
@@ -40,33 +44,38 @@ def run_direct_investor_session():
     investor_manager = InvestorDataManager(database_path='/Users/entree/PycharmProjects/chef-pipeline/chief_os/services/scrapers/snc/investors_finder/investor_database.json')
 
     try:
-        print("\n1️⃣ Starting session and login...")
+        logger.info("\n1️⃣ Starting session and login...")
         session_manager.start_session()
         
         # NEW APPROACH: Get 50 VCs from investor database instead of page navigation
-        print("\n2️⃣ Getting investors to scrape from database...")
+        logger.info("\n2️⃣ Getting investors to scrape from database...")
         investors_to_scrape = investor_manager.get_unscraped_investors(limit=50)
         
         if not investors_to_scrape:
-            print("⚠️  No unscraped investors found - all may be completed!")
+            logger.info("⚠️  No unscraped investors found - all may be completed!")
             investor_manager.print_stats()
             return
         
-        print(f"🎯 Selected {len(investors_to_scrape)} investors for scraping")
+        logger.info("🎯 Selected %s investors for scraping", len(investors_to_scrape))
+        investors_by_id = {investor['vc_id']: investor for investor in investors_to_scrape}
+        vc_id_by_url = {investor['url']: vc_id for vc_id, investor in investors_by_id.items()}
         
         # Convert investor data to URLs for existing scraping method
         vc_urls = [investor['url'] for investor in investors_to_scrape]
-        print(f"📋 URLs ready: {len(vc_urls)} VCs")
+        logger.info("📋 URLs ready: %s VCs", len(vc_urls))
         
-        print("\n3️⃣ Scraping investors using existing parallel tabs method...")
+        logger.info("\n3️⃣ Scraping investors using existing parallel tabs method...")
         # Use existing scrape_vcs_in_parallel_tabs method (no changes needed!)
         results = scraper.scrape_vcs_in_parallel_tabs(vc_urls, max_tabs=7, page_num=None)
         
-        print(f"\n4️⃣ Processing results...")
-        successful_vcs = []
-        failed_vcs = []
-        inactive_vcs = []
-        limited_info_vcs = []
+        logger.info("\n4️⃣ Processing results...")
+        successful_vcs = set()
+        failed_vcs = {}  # vc_id -> error message
+        inactive_vcs = set()
+        limited_info_vcs = set()
+        
+        # Validation results are bucketed by their status, full scraped data by whether it has content
+        validation_buckets = {'inactive': inactive_vcs, 'limited_info': limited_info_vcs}
         
         # Process results and categorize them
         for result in results:
@@ -75,43 +84,34 @@ def run_direct_investor_session():
                 
             vc_id = result.get('vc_id', '')
             if not vc_id:
-                # Try to extract vc_id from URL if not present
+                # Map the URL back to the selected investor, falling back to its last path segment
                 url = result.get('url', '')
                 if url:
-                    vc_id = url.split('/')[-1]
+                    vc_id = vc_id_by_url.get(url) or vc_id_from_url(url)
             
-            # Check if this is a validation result (not full scraped data)
             if 'validation_type' in result:
-                validation_status = result.get('status')
-                if validation_status == 'inactive':
-                    inactive_vcs.append(vc_id)
-                    investor_manager.mark_investor_as_inactive(vc_id)
-                    print(f"⚠️ {vc_id} - marked as inactive")
-                elif validation_status == 'limited_info':
-                    limited_info_vcs.append(vc_id)
-                    investor_manager.mark_investor_as_limited(vc_id)
-                    print(f"ℹ️ {vc_id} - marked as limited info")
+                bucket = validation_buckets.get(result.get('status'))
+                if bucket is not None:
+                    bucket.add(vc_id)
+            elif vc_id and result.get('name'):  # Has actual scraped content
+                successful_vcs.add(vc_id)
             else:
-                # This is full scraped data
-                if vc_id and result.get('name'):  # Has actual scraped content
-                    successful_vcs.append(vc_id)
-                    investor_manager.mark_investor_as_scraped(vc_id)
-                    print(f"✅ {vc_id} - scraped successfully")
-                else:
-                    failed_vcs.append(vc_id)
-                    investor_manager.mark_investor_as_failed(vc_id, "Scraping failed")
-                    print(f"❌ {vc_id} - failed to scrape")
+                failed_vcs[vc_id] = "Scraping failed"
         
-        # Check for any investors that weren't processed at all
-        processed_vc_ids = set(successful_vcs + failed_vcs + inactive_vcs + limited_info_vcs)
-        for investor in investors_to_scrape:
-            vc_id = investor['vc_id']
-            if vc_id not in processed_vc_ids:
-                failed_vcs.append(vc_id)
-                investor_manager.mark_investor_as_failed(vc_id, "Not processed")
-                print(f"❌ {vc_id} - not processed")
+        # Any selected investors that weren't processed at all
+        unprocessed_vcs = investors_by_id.keys() - successful_vcs - failed_vcs.keys() - inactive_vcs - limited_info_vcs
+        failed_vcs.update(dict.fromkeys(unprocessed_vcs, "Not processed"))
         
-        print("\n5️⃣ Saving results...")
+        # Apply all status transitions in one pass - the database is written once on exit
+        with investor_manager.deferred_save():
+            investor_manager.bulk_mark({
+                'scraped': successful_vcs,
+                'inactive': inactive_vcs,
+                'limited_info': limited_info_vcs,
+                'failed': failed_vcs,
+            })
+        
+        logger.info("\n5️⃣ Saving results...")
         # Filter results - only save actual scraped data, not validation results
         scraped_data_only = [result for result in results if result and 'validation_type' not in result]
         
@@ -122,30 +122,27 @@ def run_direct_investor_session():
         # Use existing save method but with new filename and filtered data
         if scraped_data_only:
             scraper.save_final_results(scraped_data_only, f"direct_batch_{timestamp}")
-            print(f"💾 Saved {len(scraped_data_only)} scraped VCs to results")
+            logger.info("💾 Saved %s scraped VCs to results", len(scraped_data_only))
         else:
-            print("💾 No scraped data to save (only validation results)")
-        
-        # Save updated investor database
-        investor_manager.save_database()
+            logger.info("💾 No scraped data to save (only validation results)")
         
-        print(f"\n🎉 Direct investor session completed!")
-        print(f"✅ Successfully scraped: {len(successful_vcs)} VCs")
-        print(f"⚠️ Inactive VCs: {len(inactive_vcs)} VCs")
-        print(f"ℹ️ Limited info VCs: {len(limited_info_vcs)} VCs") 
-        print(f"❌ Failed: {len(failed_vcs)} VCs")
-        print(f"💾 Only scraped data saved ({len([r for r in results if r and 'validation_type' not in r])} VCs)")
+        logger.info("\n🎉 Direct investor session completed!")
+        logger.info("✅ Successfully scraped: %s VCs", len(successful_vcs))
+        logger.info("⚠️ Inactive VCs: %s VCs", len(inactive_vcs))
+        logger.info("ℹ️ Limited info VCs: %s VCs", len(limited_info_vcs)) 
+        logger.info("❌ Failed: %s VCs", len(failed_vcs))
+        logger.info("💾 Only scraped data saved (%s VCs)", len([r for r in results if r and 'validation_type' not in r]))
         
         # Print updated stats
         investor_manager.print_stats()
 
     except KeyboardInterrupt:
-        print("\n⏹️  Session interrupted...")
+        logger.warning("\n⏹️  Session interrupted...")
         if 'investor_manager' in locals():
             investor_manager.save_database()
 
     except Exception as e:
-        print(f"❌ Error during session: {e}")
+        logger.error("❌ Error during session: %s", e)
         if 'investor_manager' in locals():
             investor_manager.save_database()
 
@@ -154,8 +151,8 @@ def run_direct_investor_session():
 
 
 if __name__ == "__main__":
-    print("🎯 DIRECT INVESTOR SCRAPER (STANDALONE)")
-    print("=" * 40)
-    print()
+    logger.info("🎯 DIRECT INVESTOR SCRAPER (STANDALONE)")
+    logger.info("=" * 40)
+    logger.info("")
     
     run_direct_investor_session()
\ No newline at end of file
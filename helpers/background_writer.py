@@ -0,0 +1,88 @@
+"""
+Background Writer for SNC Scraper
+Writes serialized result files on a single worker thread so scraping never waits on disk
+"""
+import atexit
+import os
+import queue
+import threading
+import weakref
+
+from services.scrapers.snc.helpers.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Live writers - one atexit hook finishes their pending writes, without keeping any alive
+_live_writers = weakref.WeakSet()
+
+
+def _close_live_writers():
+    for writer in list(_live_writers):
+        writer.close()
+
+
+atexit.register(_close_live_writers)
+
+
+def _write_loop(write_queue, errors):
+    """Worker thread - holds no reference to its BackgroundWriter, so an unused writer can be collected"""
+    while True:
+        item = write_queue.get()
+        try:
+            if item is None:
+                return
+            path, payload, on_written, on_error = item
+            try:
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.error("❌ Background write failed for %s: %s", path, e)
+                errors.append(e)
+                if on_error is not None:
+                    on_error(e)
+            else:
+                if on_written is not None:
+                    on_written()
+        except Exception as e:
+            logger.error("❌ Background write callback failed: %s", e)
+        finally:
+            write_queue.task_done()
+
+
+class BackgroundWriter:
+    """
+    Single-consumer write queue - each (path, bytes) pair is written atomically (tmp file + os.replace)
+    Failures are reported per write (on_error); close() returns the last one
+    """
+
+    def __init__(self, maxsize=4):
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._errors = []
+        self._thread = threading.Thread(target=_write_loop, args=(self._queue, self._errors),
+                                        name="snc-background-writer", daemon=True)
+        self._thread.start()
+        # Stop the worker if the writer is dropped without close(); exit is handled by _close_live_writers
+        weakref.finalize(self, self._queue.put, None).atexit = False
+        _live_writers.add(self)
+
+    def save(self, path, payload, on_written=None, on_error=None):
+        """
+        Queue already-serialized bytes for path (blocks only while the queue is full)
+        on_written() / on_error(exception) are called on the worker thread once this write is done
+        """
+        self._queue.put((path, payload, on_written, on_error))
+
+    def flush(self):
+        """Block until every queued write is done (failures are reported through on_error, not raised)"""
+        self._queue.join()
+
+    def close(self):
+        """Finish pending writes and stop the worker thread - returns the last write error, if any"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        error = self._errors[-1] if self._errors else None
+        self._errors.clear()
+        return error
@@ -4,7 +4,9 @@ Creates and configures Selenium WebDriver instances with anti-detection features
 Separated from main service to avoid circular imports
 """
 
+import itertools
 import random
+import threading
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
@@ -29,42 +31,72 @@ SCREEN_RESOLUTIONS = [
     "1280,720"
 ]
 
+# Phase 4: Every user agent / resolution combination, shuffled once and handed out
+# round-robin so drivers never share a fingerprint until all combinations are used
+_FINGERPRINTS = list(itertools.product(USER_AGENTS, SCREEN_RESOLUTIONS))
+random.shuffle(_FINGERPRINTS)
+_fingerprint_cycle = itertools.cycle(_FINGERPRINTS)
+_fingerprint_lock = threading.Lock()
+
+# Input-independent Chrome arguments, assembled once instead of on every driver creation
+_STATIC_ARGS = (
+    # Enhanced stealth mode
+    "--disable-blink-features=AutomationControlled",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    # Phase 4: Anti-detection enhancements
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-images",  # Faster loading
+    "--disable-javascript",
+)
+
+_STATIC_PREFS = {
+    "profile.default_content_setting_values": {
+        "images": 2,  # Block images for speed
+        "plugins": 2,
+        "popups": 2,
+        "geolocation": 2,
+        "notifications": 2,
+        "media_stream": 2,
+    }
+}
+
+# Enhanced stealth patches, combined into one script
+STEALTH_JS = (
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+    "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});"
+    "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});"
+)
+
+
+def _next_fingerprint():
+    """Return the next (user_agent, screen_resolution) pair from the shuffled rotation"""
+    with _fingerprint_lock:
+        return next(_fingerprint_cycle)
+
 
 def create_stealth_driver(proxy=None, user_agent=None, headless=False):
     """Create enhanced stealth driver with anti-detection features"""
     chrome_options = Options()
 
-    # Phase 4: Random user agent if not specified
+    # Phase 4: Rotated user agent (if not specified) + screen resolution
+    default_user_agent, screen_res = _next_fingerprint()
     if user_agent is None:
-        user_agent = random.choice(USER_AGENTS)
-
-    # Phase 4: Random screen resolution
-    screen_res = random.choice(SCREEN_RESOLUTIONS)
+        user_agent = default_user_agent
 
-    # Enhanced stealth mode
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    # Static stealth / anti-detection flags and prefs (built once at import)
+    for argument in _STATIC_ARGS:
+        chrome_options.add_argument(argument)
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.add_argument("--disable-web-security")
-    chrome_options.add_argument("--allow-running-insecure-content")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_experimental_option("prefs", _STATIC_PREFS)
 
-    # Phase 4: Anti-detection enhancements
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--disable-plugins")
-    chrome_options.add_argument("--disable-images")  # Faster loading
-    chrome_options.add_argument("--disable-javascript")
-    chrome_options.add_experimental_option("prefs", {
-        "profile.default_content_setting_values": {
-            "images": 2,  # Block images for speed
-            "plugins": 2,
-            "popups": 2,
-            "geolocation": 2,
-            "notifications": 2,
-            "media_stream": 2,
-        }
-    })
+    # Return from driver.get() at DOMContentLoaded instead of waiting for every
+    # subresource - callers already wait explicitly for the elements they need
+    chrome_options.page_load_strategy = "eager"
 
     # Headless mode for testing
     if headless:
@@ -80,9 +112,21 @@ def create_stealth_driver(proxy=None, user_agent=None, headless=False):
 
     driver = webdriver.Chrome(options=chrome_options)
 
-    # Enhanced stealth scripts
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
-    driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']})")
+    # Enhanced stealth scripts - registered once, applied before page scripts on every navigation
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': STEALTH_JS})
+
+    return driver
+
+def open_new_tab(driver, url):
+    """
+    Open url in a new tab of the existing browser and return its window handle
 
-    return driver
\ No newline at end of file
+    Uses the CDP Target.createTarget command, whose target id is the window handle,
+    so no window_handles round-trip/diffing is needed. Falls back to window.open.
+    """
+    try:
+        return driver.execute_cdp_cmd('Target.createTarget', {'url': url, 'background': True})['targetId']
+    except Exception:
+        existing_windows = set(driver.window_handles)
+        driver.execute_script("window.open(arguments[0], '_blank');", url)
+        return next(w for w in driver.window_handles if w not in existing_windows)
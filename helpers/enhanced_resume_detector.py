@@ -6,13 +6,64 @@ Step 3: Experimental addition - does not modify existing resume logic.
 All features disabled by default to ensure zero impact on current workflow.
 """
 
+import functools
 import os
-import re
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Optional, Tuple
 
 from services.scrapers.snc.helpers.vc_cache_manager import VCCacheManager
 
 
+def _parse_page_filename(filename: str) -> Optional[Tuple[int, str]]:
+    """
+    Parse a page result filename, e.g. page_3_in_progress_4_vcs_094023.json
+
+    Plain string ops - the name format is fixed, so no regex is needed.
+
+    Returns:
+        (page_num, status) where status is 'in_progress', 'completed' or '', or None if not a page file
+    """
+    if not filename.startswith('page_') or not filename.endswith('.json'):
+        return None
+    num_str, sep, tail = filename[5:].partition('_')
+    if not sep or not num_str.isdigit():
+        return None
+    if 'in_progress' in tail:
+        status = 'in_progress'
+    elif 'completed' in tail:
+        status = 'completed'
+    else:
+        status = ''
+    return int(num_str), status
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_page_files(results_dir: str, dir_mtime_ns: int) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+    """
+    Classify page files in results_dir in a single directory pass
+
+    Memoized on the directory mtime, so repeated lookups during one resume
+    detection reuse the same scan until a file is added, renamed or removed.
+
+    Returns:
+        (in_progress_pages, completed_pages)
+    """
+    in_progress_pages = set()
+    completed_pages = set()
+
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            parsed = _parse_page_filename(entry.name)
+            if parsed is None:
+                continue
+            page_num, status = parsed
+            if status == 'in_progress':
+                in_progress_pages.add(page_num)
+            elif status == 'completed':
+                completed_pages.add(page_num)
+
+    return frozenset(in_progress_pages), frozenset(completed_pages)
+
+
 class EnhancedResumeDetector:
     """
     EXPERIMENTAL: Enhanced resume detection with cache integration
@@ -76,28 +127,25 @@ class EnhancedResumeDetector:
             print("🔄 Falling back to existing resume logic")
             return None
     
+    def _scan_results_dir(self) -> Optional[Tuple[FrozenSet[int], FrozenSet[int]]]:
+        """Scan results directory once: (in_progress_pages, completed_pages), or None if it doesn't exist"""
+        results_dir = self.scraper.results_dir
+        if not os.path.exists(results_dir):
+            return None
+        return _scan_page_files(results_dir, os.stat(results_dir).st_mtime_ns)
+
     def _find_last_in_progress_page(self) -> Optional[int]:
         """Find the highest page number that is in progress"""
         try:
-            results_dir = self.scraper.results_dir
-            if not os.path.exists(results_dir):
+            scan = self._scan_results_dir()
+            if scan is None:
                 return None
             
-            in_progress_pages = []
-            
-            for filename in os.listdir(results_dir):
-                if 'in_progress' in filename and filename.endswith('.json'):
-                    # Extract page number from filename
-                    match = re.search(r'page_(\d+)_', filename)
-                    if match:
-                        page_num = int(match.group(1))
-                        in_progress_pages.append(page_num)
-                        print(f"  📋 Found in-progress page: {page_num}")
+            in_progress_pages, _ = scan
+            for page_num in sorted(in_progress_pages):
+                print(f"  📋 Found in-progress page: {page_num}")
             
-            if in_progress_pages:
-                return max(in_progress_pages)
-            
-            return None
+            return max(in_progress_pages, default=None)
             
         except Exception as e:
             print(f"❌ Error finding in-progress pages: {e}")
@@ -106,23 +154,12 @@ class EnhancedResumeDetector:
     def _find_next_available_page(self) -> int:
         """Find the next page that should be processed"""
         try:
-            results_dir = self.scraper.results_dir
-            if not os.path.exists(results_dir):
+            scan = self._scan_results_dir()
+            if scan is None:
                 return 1
             
-            completed_pages = []
-            
-            for filename in os.listdir(results_dir):
-                if 'completed' in filename and filename.endswith('.json'):
-                    match = re.search(r'page_(\d+)_', filename)
-                    if match:
-                        page_num = int(match.group(1))
-                        completed_pages.append(page_num)
-            
-            if completed_pages:
-                return max(completed_pages) + 1
-            
-            return 1
+            _, completed_pages = scan
+            return max(completed_pages, default=0) + 1
             
         except Exception as e:
             print(f"❌ Error finding next available page: {e}")
@@ -170,19 +207,17 @@ class EnhancedResumeDetector:
             # This would require actually navigating to the page to get VCs
             # For now, we'll use a simplified approach based on existing files
             
-            results_dir = self.scraper.results_dir
-            if not os.path.exists(results_dir):
+            scan = self._scan_results_dir()
+            if scan is None:
                 return True  # Page needs work if no results exist
             
-            # Look for existing page file
-            for filename in os.listdir(results_dir):
-                if filename.startswith(f'page_{page_num}_') and filename.endswith('.json'):
-                    if 'completed' in filename:
-                        print(f"  ✅ Page {page_num} marked as completed")
-                        return False
-                    elif 'in_progress' in filename:
-                        print(f"  🔄 Page {page_num} marked as in progress")
-                        return True
+            in_progress_pages, completed_pages = scan
+            if page_num in completed_pages:
+                print(f"  ✅ Page {page_num} marked as completed")
+                return False
+            if page_num in in_progress_pages:
+                print(f"  🔄 Page {page_num} marked as in progress")
+                return True
             
             # No file found - page needs work
             print(f"  📄 Page {page_num} not processed yet")
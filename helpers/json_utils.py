@@ -0,0 +1,50 @@
+"""
+JSON Utilities for SNC Scraper
+Fast JSON file loading/saving - uses orjson when installed, stdlib json otherwise
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_decoder = json.JSONDecoder()
+
+
+def load_json(path):
+    """Load a JSON file (parsed straight from bytes, no text decoding step)"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_json(data, indent=True):
+    """Serialize data to UTF-8 encoded JSON bytes"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def save_json(path, data, indent=True):
+    """Save data to a JSON file"""
+    with open(path, 'wb') as f:
+        f.write(dumps_json(data, indent=indent))
+
+
+def extract_json_array(text, key):
+    """
+    Parse the JSON array that follows '"key":' in text (e.g. a page source with embedded JSON)
+    Only the array itself is decoded - returns None if the key isn't followed by an array
+    """
+    marker = f'"{key}":['
+    start = text.find(marker)
+    if start < 0:
+        return None
+    value, _ = _decoder.raw_decode(text, start + len(marker) - 1)
+    return value
@@ -0,0 +1,40 @@
+"""
+Logging Utilities for SNC Scraper
+Queue-backed progress logging - scraper threads only enqueue records, a background listener writes them
+"""
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+def setup_logging(verbose=False):
+    """
+    Route the 'snc' loggers through a queue to stdout (safe to call more than once - only the level changes)
+    
+    The listener is kept on the 'snc' logger itself, so setup happens once per process even when this
+    module is imported under two names (helpers.log_utils and services.scrapers.snc.helpers.log_utils)
+    """
+    snc_logger = logging.getLogger('snc')
+    snc_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    if getattr(snc_logger, '_queue_listener', None) is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))  # Same output as the print-based progress lines
+
+    snc_logger.addHandler(QueueHandler(log_queue))
+    snc_logger.propagate = False
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    snc_logger._queue_listener = listener
+    atexit.register(listener.stop)  # Drain queued records on exit
+
+
+def get_logger(name):
+    """Get a logger under the 'snc' namespace (sets up queue logging on first use)"""
+    if getattr(logging.getLogger('snc'), '_queue_listener', None) is None:
+        setup_logging()
+    return logging.getLogger(f'snc.{name}')
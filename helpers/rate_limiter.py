@@ -0,0 +1,47 @@
+"""
+Rate Limiter for SNC Scraper
+Token bucket that paces page requests up front instead of reacting after the site rate-limits us
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """Refills at `rate` tokens per second up to `capacity` - acquire() blocks until a token is available"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Take one token, sleeping until one is available; returns the seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def drain(self, seconds):
+        """Empty the bucket and hold every acquire() for `seconds` (e.g. a Retry-After after a 429)"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(1, self.capacity)  # A single request is allowed once the hold is over
+            self._updated = now + seconds  # Refill only starts after the hold
+            self._blocked_until = max(self._blocked_until, now + seconds)
@@ -2,15 +2,76 @@
 Search Page Helper for SNC Scraper
 Handles search page navigation, VC extraction, and filtering
 """
+import functools
+import logging
 import time
 import random
 import os
-import json
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
+from services.scrapers.snc.helpers.json_utils import load_json
+from services.scrapers.snc.helpers.log_utils import get_logger
 from services.scrapers.snc.helpers.vc_cache_manager import VCCacheManager
+from services.scrapers.snc.helpers.url_utils import vc_id_from_url
+
+logger = get_logger(__name__)
+
+# Investor profile links on search result pages
+INVESTOR_LINK_CSS = 'a[href*="/investor_page/"]'
+# Collect every matching href in one browser round-trip (instead of one get_attribute call per element)
+COLLECT_INVESTOR_HREFS_JS = "return Array.from(document.querySelectorAll(arguments[0]), a => a.href);"
+
+
+def collect_investor_hrefs(driver):
+    """Investor link hrefs on the current page - an empty list is falsy, so this doubles as a wait condition"""
+    return driver.execute_script(COLLECT_INVESTOR_HREFS_JS, INVESTOR_LINK_CSS)
+
+
+def determine_vc_status(vc_data):
+    """
+    Determine if a VC was already scraped based on key fields
+    Args:
+        vc_data: Dictionary containing VC information
+    Returns:
+        "scraped" if VC has key data, "not_scraped" otherwise
+    """
+    if not isinstance(vc_data, dict):
+        return "not_scraped"
+    
+    # Presence flags for the key overview fields + investments data
+    key = (
+        bool(vc_data.get('founded')),
+        bool(vc_data.get('overview')),
+        bool(vc_data.get('exits')),
+        bool(vc_data.get('investment_stages')),
+        bool(vc_data.get('investments')),
+    )
+    return _status_from_key(key)
+
+
+@functools.lru_cache(maxsize=32)
+def _status_from_key(key):
+    """Status for a tuple of field-presence flags (only 32 combinations, so every one is memoized)"""
+    has_key_overview = key[0] or key[1] or key[2] or key[3]
+    has_investments = key[4]
+    
+    if has_key_overview and has_investments:
+        return "scraped"
+    else:
+        return "not_scraped"
+
+
+def get_scraped_vc_ids(vcs):
+    """Set of VC IDs in a page's VC list that were fully scraped (stored in page metadata as scraped_vc_ids)"""
+    return {
+        vc['vc_id'] for vc in vcs
+        if isinstance(vc, dict) and vc.get('vc_id') and determine_vc_status(vc) == 'scraped'
+    }
+
+
+def url_slug_pairs(urls):
+    """Pair each VC URL with its slug once, so chained filters don't re-extract it"""
+    return [(url, vc_id_from_url(url)) for url in urls]
 
 
 # Step 2: Import cache manager for optional cache discovery
@@ -20,6 +81,19 @@ class SearchPageHelper:
     def __init__(self, scraper_instance):
         """Initialize navigation helper with reference to scraper instance"""
         self.scraper = scraper_instance
+        self._waits = {}  # timeout -> WebDriverWait, reused while the driver stays the same
+        self._wait_driver = None
+    
+    def _wait(self, timeout):
+        """Get a reusable WebDriverWait for the current driver"""
+        driver = self.scraper.driver
+        if driver is not self._wait_driver:
+            self._waits = {}
+            self._wait_driver = driver
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(driver, timeout)
+        return wait
     
     def navigate_to_page(self, page_num):
         """Navigate directly to specific page using URL parameter"""
@@ -28,7 +102,7 @@ class SearchPageHelper:
             base_url = "https://finder.startupnationcentral.org/investors/search?&fundingtype=VC+and+Private+Equity&status=Active"
             page_url = f"{base_url}&page={page_num}"
 
-            print(f"🔄 Navigating to page {page_num}: {page_url}")
+            logger.info("🔄 Navigating to page %s: %s", page_num, page_url)
 
             # Navigate to page URL
             self.scraper.driver.get(page_url)
@@ -36,53 +110,46 @@ class SearchPageHelper:
             # Wait for page to load
             time.sleep(random.uniform(2.0, 4.0))
 
-            # Verify page loaded by checking for investor links
+            # Verify page loaded by checking for investor links (wait and count in the same script call)
             try:
-                WebDriverWait(self.scraper.driver, 15).until(
-                    EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/investor_page/')]"))
-                )
-                print(f"✅ Successfully loaded page {page_num}")
-
-                # Simple verification: check if VC links exist on page
-                try:
-                    vc_elements = self.scraper.driver.find_elements(By.XPATH, "//a[contains(@href, '/investor_page/')]")
-                    if vc_elements:
-                        print(f"✅ Verified: {len(vc_elements)} VCs found on page {page_num}")
-                        return True
-                    else:
-                        print(f"⚠️  No VCs found on page {page_num} - might be last page")
-                        return False
-                except Exception:
-                    print(f"⚠️  Could not verify VCs on page {page_num}")
-                    return True  # Assume success if we can't verify
+                vc_hrefs = self._wait(15).until(collect_investor_hrefs)
+                logger.info("✅ Successfully loaded page %s", page_num)
+                logger.info("✅ Verified: %s VCs found on page %s", len(vc_hrefs), page_num)
+                return True
 
             except Exception as e:
-                print(f"⚠️  Page {page_num} load verification failed: {e}")
+                logger.warning("⚠️  Page %s load verification failed: %s", page_num, e)
                 return False
 
         except Exception as e:
-            print(f"❌ Error navigating to page {page_num}: {e}")
+            logger.warning("❌ Error navigating to page %s: %s", page_num, e)
             return False
     
+    def _extract_hrefs(self, wait_timeout=None):
+        """Collect investor link hrefs from the current page, optionally waiting up to wait_timeout seconds for them"""
+        if wait_timeout:
+            # Poll until investor links are present - the last poll already returns their hrefs
+            hrefs = self._wait(wait_timeout).until(collect_investor_hrefs)
+        else:
+            hrefs = collect_investor_hrefs(self.scraper.driver)
+        return [href for href in hrefs if href]
+    
+    def _extract_hrefs_with_fallback(self, wait_timeout=20):
+        """Collect investor hrefs, retrying once without waiting if the wait times out"""
+        try:
+            return self._extract_hrefs(wait_timeout)
+        except Exception as e:
+            logger.warning("⚠️  Waiting for VC links failed (%s) - retrying without wait", e)
+            return self._extract_hrefs()
+    
     def extract_vc_links_from_search_page(self):
         """Extract all VC investor links from current search results page with duplicate filtering"""
         try:
-            # Wait for page to load (look for investor links instead of specific container)
-            wait = WebDriverWait(self.scraper.driver, 20)
-            wait.until(EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/investor_page/')]")))
-
-            # Find all investor links directly
-            investor_links = []
-            link_elements = self.scraper.driver.find_elements(By.XPATH, "//a[contains(@href, '/investor_page/')]")
-
-            for element in link_elements:
-                href = element.get_attribute('href')
-                if href and '/investor_page/' in href:
-                    investor_links.append(href)
+            investor_links = self._extract_hrefs_with_fallback()
 
             # Remove duplicates within this page
-            unique_links = list(set(investor_links))
-            print(f"📋 Found {len(unique_links)} unique VC links on this page")
+            unique_links = list(dict.fromkeys(investor_links))  # Order-preserving dedup
+            logger.info("📋 Found %s unique VC links on this page", len(unique_links))
 
             # Load existing page data to determine what needs scraping
             existing_vcs, status = self.load_existing_page_data(self.scraper.current_page)
@@ -90,26 +157,12 @@ class SearchPageHelper:
             # Filter VCs that need scraping using new logic
             vcs_to_scrape = self.filter_unscraped_vcs(unique_links, existing_vcs)
             
-            print(f"✅ VCs to scrape: {len(vcs_to_scrape)}")
+            logger.info("✅ VCs to scrape: %s", len(vcs_to_scrape))
             return vcs_to_scrape
 
         except Exception as e:
-            print(f"❌ Error extracting VC links: {e}")
-            # Fallback: try without waiting
-            try:
-                link_elements = self.scraper.driver.find_elements(By.XPATH, "//a[contains(@href, '/investor_page/')]")
-                investor_links = [elem.get_attribute('href') for elem in link_elements if elem.get_attribute('href')]
-                unique_links = list(set(investor_links))
-                print(f"📋 Fallback found {len(unique_links)} unique VC links")
-
-                # Use same filtering logic in fallback
-                existing_vcs, status = self.load_existing_page_data(self.scraper.current_page)
-                vcs_to_scrape = self.filter_unscraped_vcs(unique_links, existing_vcs)
-                
-                print(f"✅ Fallback VCs to scrape: {len(vcs_to_scrape)}")
-                return vcs_to_scrape
-            except:
-                return []
+            logger.warning("❌ Error extracting VC links: %s", e)
+            return []
     
     def load_existing_page_data(self, page_num):
         """
@@ -117,100 +170,99 @@ class SearchPageHelper:
         Returns: (vcs_list, status) or (None, None) if no existing data
         """
         try:
+            # In-memory page index (built by StateManager, kept current by page saves)
+            page_index = getattr(self.scraper, 'page_index', None)
+            indexed = page_index.get(page_num) if page_index is not None else None
+            if indexed is not None:
+                vcs_list, status = indexed["vcs"], indexed["status"]
+                logger.info("📁 Loaded existing page %s data: %s VCs (status: %s)", page_num, len(vcs_list), status)
+                return vcs_list, status
+            
+            writer = getattr(self.scraper, 'writer', None)
+            if writer is not None:
+                writer.flush()  # Queued page writes must be on disk before we look for them
+            
             results_dir = self.scraper.results_dir
             if not os.path.exists(results_dir):
                 return None, None
             
             # Look for existing page file (in_progress or completed)
-            for filename in os.listdir(results_dir):
-                if filename.startswith(f'page_{page_num}_') and filename.endswith('.json'):
-                    filepath = os.path.join(results_dir, filename)
-                    
-                    with open(filepath, 'r') as f:
-                        page_data = json.load(f)
-                    
-                    # Handle both old and new JSON formats
-                    if isinstance(page_data, dict) and "vcs" in page_data:
-                        # New enhanced format with metadata
-                        vcs_list = page_data["vcs"]
-                        status = page_data.get("metadata", {}).get("status", "unknown")
-                        print(f"📁 Loaded existing page {page_num} data: {len(vcs_list)} VCs (status: {status})")
+            with os.scandir(results_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if filename.startswith(f'page_{page_num}_') and filename.endswith('.json'):
+                        page_data = load_json(entry.path)
+                        
+                        # Handle both old and new JSON formats
+                        if isinstance(page_data, dict) and "vcs" in page_data:
+                            # New enhanced format with metadata
+                            vcs_list = page_data["vcs"]
+                            metadata = page_data.get("metadata", {})
+                            status = metadata.get("status", "unknown")
+                        elif isinstance(page_data, list):
+                            # Legacy format - direct VC list
+                            vcs_list, metadata = page_data, {}
+                            status = "completed" if "completed" in filename else "in_progress"
+                        else:
+                            continue
+                        
+                        if page_index is not None:
+                            page_index[page_num] = {"path": entry.path, "status": status, "vcs": vcs_list, "metadata": metadata}
+                        logger.info("📁 Loaded existing page %s data: %s VCs (status: %s)", page_num, len(vcs_list), status)
                         return vcs_list, status
-                    elif isinstance(page_data, list):
-                        # Legacy format - direct VC list
-                        status = "completed" if "completed" in filename else "in_progress"
-                        print(f"📁 Loaded legacy page {page_num} data: {len(page_data)} VCs (status: {status})")
-                        return page_data, status
             
             # No existing data found
-            print(f"📄 No existing data found for page {page_num}")
+            logger.info("📄 No existing data found for page %s", page_num)
             return None, None
             
         except Exception as e:
-            print(f"❌ Error loading existing page data: {e}")
+            logger.warning("❌ Error loading existing page data: %s", e)
             return None, None
     
-    def filter_unscraped_vcs(self, all_vc_links, existing_vcs):
+    def filter_unscraped_vcs(self, all_vc_links, existing_vcs, page_metadata=None, slugs=None):
         """
         Filter VCs that need scraping by comparing with existing data
         Args:
             all_vc_links: List of VC URLs extracted from current page
             existing_vcs: List of existing VC data from JSON
+            page_metadata: Optional page metadata - its scraped_vc_ids list is used when present
+            slugs: Optional precomputed slugs, parallel to all_vc_links
         Returns:
             List of VC URLs that need scraping
         """
+        pairs = list(zip(all_vc_links, slugs)) if slugs is not None else url_slug_pairs(all_vc_links)
+        return [url for url, _ in self._filter_unscraped_pairs(pairs, existing_vcs, page_metadata)]
+    
+    def _filter_unscraped_pairs(self, pairs, existing_vcs, page_metadata=None):
+        """filter_unscraped_vcs on (url, slug) pairs - returns the pairs that still need scraping"""
         if not existing_vcs:
             # No existing data - all VCs need scraping
-            print(f"🆕 New page: All {len(all_vc_links)} VCs need scraping")
-            return all_vc_links
+            logger.info("🆕 New page: All %s VCs need scraping", len(pairs))
+            return pairs
         
-        # Build set of already scraped VC IDs for fast lookup
-        scraped_vc_ids = set()
-        for vc in existing_vcs:
-            if isinstance(vc, dict):
-                vc_id = vc.get('vc_id', '')
-                if vc_id:
-                    # Use smart status detection instead of relying on vc_status field
-                    vc_status = self.determine_vc_status(vc)
-                    if vc_status == 'scraped':
-                        scraped_vc_ids.add(vc_id)
+        # Set of already scraped VC IDs for fast lookup - saved with the page, re-derived for legacy files
+        if page_metadata and "scraped_vc_ids" in page_metadata:
+            scraped_vc_ids = set(page_metadata["scraped_vc_ids"])
+        else:
+            # Use smart status detection instead of relying on vc_status field
+            scraped_vc_ids = get_scraped_vc_ids(existing_vcs)
+        
+        # Fully scraped page (common on resume) - one set check instead of a per-VC filter
+        if len(scraped_vc_ids) >= len(pairs) and scraped_vc_ids.issuperset(vc_id for _, vc_id in pairs):
+            logger.info("✅ All %s VCs on this page already scraped", len(pairs))
+            return []
         
         # Filter out already scraped VCs
-        vcs_to_scrape = []
-        for url in all_vc_links:
-            # Extract VC ID from URL
-            vc_id = url.split('/')[-1] if '/' in url else url
-            
-            if vc_id not in scraped_vc_ids:
-                vcs_to_scrape.append(url)
+        pairs_to_scrape = [(url, vc_id) for url, vc_id in pairs if vc_id not in scraped_vc_ids]
         
-        print(f"🔄 Resume page: {len(scraped_vc_ids)} VCs already scraped, {len(vcs_to_scrape)} VCs need scraping")
-        print(f"📊 Progress: {len(scraped_vc_ids)}/{len(all_vc_links)} VCs completed")
+        logger.info("🔄 Resume page: %s VCs already scraped, %s VCs need scraping", len(scraped_vc_ids), len(pairs_to_scrape))
+        logger.info("📊 Progress: %s/%s VCs completed", len(scraped_vc_ids), len(pairs))
         
-        return vcs_to_scrape
+        return pairs_to_scrape
     
     def determine_vc_status(self, vc_data):
-        """
-        Determine if a VC was already scraped based on key fields
-        Args:
-            vc_data: Dictionary containing VC information
-        Returns:
-            "scraped" if VC has key data, "not_scraped" otherwise
-        """
-        if not isinstance(vc_data, dict):
-            return "not_scraped"
-        
-        # Check for KEY overview fields (not all - some can be missing)
-        key_overview_fields = ['founded', 'overview', 'exits', 'investment_stages']
-        has_key_overview = any(vc_data.get(field) for field in key_overview_fields)
-        
-        # Check for investments data
-        has_investments = bool(vc_data.get('investments'))
-        
-        if has_key_overview and has_investments:
-            return "scraped"
-        else:
-            return "not_scraped"
+        """Determine if a VC was already scraped based on key fields (see module-level determine_vc_status)"""
+        return determine_vc_status(vc_data)
     
     # ======================================================
     # STEP 2: OPTIONAL CACHE DISCOVERY METHODS
@@ -228,85 +280,84 @@ class SearchPageHelper:
             List[str]: VC URLs that need scraping (same format as existing method)
         """
         try:
-            print(f"🔍 Extracting VCs from page {self.scraper.current_page} (with cache filtering: {enable_cache_filtering})")
-            
-            # Step 1: Use existing proven URL extraction logic (UNCHANGED)
-            wait = WebDriverWait(self.scraper.driver, 20)
-            wait.until(EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/investor_page/')]")))
-            
-            # Find all investor links directly (same as existing method)
-            investor_links = []
-            link_elements = self.scraper.driver.find_elements(By.XPATH, "//a[contains(@href, '/investor_page/')]")
+            logger.info("🔍 Extracting VCs from page %s (with cache filtering: %s)", self.scraper.current_page, enable_cache_filtering)
             
-            for element in link_elements:
-                href = element.get_attribute('href')
-                if href and '/investor_page/' in href:
-                    investor_links.append(href)
+            # Step 1: Use existing proven URL extraction logic (same as existing method)
+            investor_links = self._extract_hrefs_with_fallback()
             
             # Remove duplicates within this page (same as existing)
-            unique_links = list(set(investor_links))
-            print(f"📋 Found {len(unique_links)} unique VC links on this page")
+            unique_links = list(dict.fromkeys(investor_links))  # Order-preserving dedup
+            logger.info("📋 Found %s unique VC links on this page", len(unique_links))
             
             # Step 2: Apply cache filtering if enabled (NEW OPTIONAL FEATURE)
             if enable_cache_filtering:
                 filtered_links = self._filter_links_by_cache(unique_links)
-                print(f"🔍 Cache filtering result: {len(filtered_links)}/{len(unique_links)} VCs need scraping")
+                logger.info("🔍 Cache filtering result: %s/%s VCs need scraping", len(filtered_links), len(unique_links))
                 return filtered_links
             else:
-                print(f"💡 Cache filtering disabled - returning all {len(unique_links)} VCs")
+                logger.info("💡 Cache filtering disabled - returning all %s VCs", len(unique_links))
                 return unique_links
                 
         except Exception as e:
-            print(f"❌ Error extracting VC links with cache filtering: {e}")
-            # Fallback: try basic extraction without cache filtering
-            try:
-                link_elements = self.scraper.driver.find_elements(By.XPATH, "//a[contains(@href, '/investor_page/')]")
-                investor_links = [elem.get_attribute('href') for elem in link_elements if elem.get_attribute('href')]
-                unique_links = list(set(investor_links))
-                print(f"📋 Fallback extraction: {len(unique_links)} VCs found")
-                return unique_links
-            except:
-                return []
+            logger.warning("❌ Error extracting VC links with cache filtering: %s", e)
+            return []
     
-    def _filter_links_by_cache(self, vc_links):
+    def _filter_links_by_cache(self, vc_links, slugs=None):
         """
         Filter VC links using cache data (simplified and reliable)
         
         Args:
             vc_links: List of VC URLs
+            slugs: Optional precomputed slugs, parallel to vc_links
             
         Returns:
             List of VC URLs that are not completed in cache
         """
+        pairs = list(zip(vc_links, slugs)) if slugs is not None else url_slug_pairs(vc_links)
+        return [url for url, _ in self._filter_pairs_by_cache(pairs)]
+    
+    def _get_cache_manager(self):
+        """VCCacheManager shared on the scraper - the cache file is read once, not once per page"""
+        cache_manager = getattr(self.scraper, '_cache_manager', None)
+        if cache_manager is None:
+            cache_manager = self.scraper._cache_manager = VCCacheManager()
+        return cache_manager
+    
+    def _filter_pairs_by_cache(self, pairs):
+        """_filter_links_by_cache on (url, slug) pairs - returns the pairs not completed in cache"""
         try:
-            cache_manager = VCCacheManager()
+            cache_manager = self._get_cache_manager()
+            completed_slugs = cache_manager.get_completed_set()
             
-            filtered_links = []
-            cache_filtered_count = 0
+            # Completed slugs on this page via one C-level set intersection
+            completed_here = completed_slugs.intersection(slug for _, slug in pairs)
             
-            for url in vc_links:
-                # Extract slug from URL (same logic as existing system)
-                slug = url.split('/')[-1] if '/' in url else url
-                
-                # Check if VC is completed in cache
-                if cache_manager.is_vc_completed(slug):
-                    cache_filtered_count += 1
-                    print(f"  🔍 Cache: {slug} already completed - skipping")
-                else:
-                    filtered_links.append(url)
-                    print(f"  ✅ Cache: {slug} needs scraping - keeping")
+            # Drop VCs completed in cache (nothing to drop on fresh pages - keep the list as is)
+            if completed_here:
+                filtered_pairs = [(url, slug) for url, slug in pairs if slug not in completed_here]
+            else:
+                filtered_pairs = pairs
+            cache_filtered_count = len(pairs) - len(filtered_pairs)
             
-            print(f"🔍 Cache filtering summary:")
-            print(f"  ⏩ Filtered out (completed): {cache_filtered_count}")
-            print(f"  ✅ Still need scraping: {len(filtered_links)}")
+            # Per-VC decisions only in verbose mode (debug level) - summary below is always printed
+            if logger.isEnabledFor(logging.DEBUG):
+                for _, slug in pairs:
+                    if slug in completed_here:
+                        logger.debug("  🔍 Cache: %s already completed - skipping", slug)
+                    else:
+                        logger.debug("  ✅ Cache: %s needs scraping - keeping", slug)
+            
+            logger.info("🔍 Cache filtering summary:")
+            logger.info("  ⏩ Filtered out (completed): %s", cache_filtered_count)
+            logger.info("  ✅ Still need scraping: %s", len(filtered_pairs))
             
-            return filtered_links
+            return filtered_pairs
             
         except Exception as e:
-            print(f"❌ Error in cache filtering: {e}")
-            print(f"🔄 Returning original list without cache filtering")
+            logger.warning("❌ Error in cache filtering: %s", e)
+            logger.info("🔄 Returning original list without cache filtering")
             # Return original list if cache filtering fails
-            return vc_links
+            return pairs
     
     # Note: Removed overcomplicated name extraction methods - names are captured during VC scraping
     
@@ -321,15 +372,18 @@ class SearchPageHelper:
         Returns:
             List of VC URLs that need scraping
         """
+        # Slugs are extracted once and carried through both filters
+        pairs = url_slug_pairs(all_vc_links)
+        
         # First, use existing filtering logic (unchanged)
         existing_vcs, status = self.load_existing_page_data(self.scraper.current_page)
-        vcs_to_scrape = self.filter_unscraped_vcs(all_vc_links, existing_vcs)
+        pairs = self._filter_unscraped_pairs(pairs, existing_vcs)
         
         # Optional cache-based filtering (Step 2 feature)
         if enable_cache_filtering:
-            print(f"🔍 Applying additional cache-based filtering...")
-            vcs_to_scrape = self._filter_links_by_cache(vcs_to_scrape)
+            logger.info("🔍 Applying additional cache-based filtering...")
+            pairs = self._filter_pairs_by_cache(pairs)
         else:
-            print(f"💡 Cache filtering disabled - using existing logic only")
+            logger.info("💡 Cache filtering disabled - using existing logic only")
         
-        return vcs_to_scrape
\ No newline at end of file
+        return [url for url, _ in pairs]
\ No newline at end of file
@@ -2,13 +2,32 @@
 Session Manager for SNC Scraper
 Handles browser session initialization, proxy setup, and authentication
 """
+import itertools
 import random
+import time
 
 import requests
+from requests.adapters import HTTPAdapter
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 
 from services.scrapers.snc.helpers.driver_factory import create_stealth_driver
+from services.scrapers.snc.helpers.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+_http_session = None  # requests.Session, created on first ScraperAPI call
+
+
+def _get_http_session():
+    """Keep-alive HTTP session for ScraperAPI calls, shared by every SessionManager"""
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        _http_session.mount('http://', adapter)
+        _http_session.mount('https://', adapter)
+    return _http_session
 
 
 class SessionManager:
@@ -16,21 +35,27 @@ class SessionManager:
         """Initialize session manager with reference to scraper instance"""
         self.scraper = scraper_instance
 
+        # Round-robin over a shuffled copy of the UA pool - no immediate repeats, short form kept for logging
+        user_agents = list(self.scraper.user_agent_pool)
+        random.shuffle(user_agents)
+        self._ua_cycle = itertools.cycle(user_agents)
+        self._ua_short = {ua: ua[:50] for ua in user_agents}
+
     def _verbose_print(self, message):
         """Print message only if verbose mode is enabled"""
         if self.scraper.verbose:
-            print(message)
+            logger.info(message)
 
     def _rotate_user_agent(self):
         """Phase 4: Rotate to a new user agent"""
-        self.scraper.current_user_agent = random.choice(self.scraper.user_agent_pool)
-        self._verbose_print(f"🔄 Rotated to user agent: {self.scraper.current_user_agent[:50]}...")
+        self.scraper.current_user_agent = next(self._ua_cycle)
+        self._verbose_print(f"🔄 Rotated to user agent: {self._ua_short[self.scraper.current_user_agent]}...")
         return self.scraper.current_user_agent
 
     def _get_scraperapi_session_proxy(self):
         """Get a session-based proxy from ScraperAPI (one IP for entire session)"""
         if not self.scraper.scraperapi_key:
-            print("❌ ScraperAPI key not configured")
+            logger.warning("❌ ScraperAPI key not configured")
             return None
 
         try:
@@ -42,39 +67,39 @@ class SessionManager:
             }
 
             # Get account info and session details
-            response = requests.get(api_url, params=params, timeout=10)
+            response = _get_http_session().get(api_url, params=params, timeout=10)
 
             if response.status_code == 200:
                 # For ScraperAPI, we use their proxy endpoint format
                 session_proxy = f"http://{self.scraper.scraperapi_key}:@proxy-server.scraperapi.com:8001"
 
-                print(f"✅ ScraperAPI session proxy obtained for {self.scraper.scraperapi_country}")
-                print(f"   🌍 Country: {self.scraper.scraperapi_country}")
-                print(f"   📡 Session-based IP (same for entire browser session)")
+                logger.info("✅ ScraperAPI session proxy obtained for %s", self.scraper.scraperapi_country)
+                logger.info("   🌍 Country: %s", self.scraper.scraperapi_country)
+                logger.info("   📡 Session-based IP (same for entire browser session)")
 
                 return session_proxy
             else:
-                print(f"❌ ScraperAPI error: {response.status_code}")
-                print(f"   Response: {response.text}")
+                logger.warning("❌ ScraperAPI error: %s", response.status_code)
+                logger.info("   Response: %s", response.text)
                 return None
 
         except Exception as e:
-            print(f"❌ Error getting ScraperAPI session proxy: {e}")
+            logger.warning("❌ Error getting ScraperAPI session proxy: %s", e)
             return None
 
     def _setup_session_proxy(self):
         """Setup session proxy based on connection type"""
         if self.scraper.connection_type == "scraperapi":
-            print("🔄 Setting up ScraperAPI session-based proxy...")
+            logger.info("🔄 Setting up ScraperAPI session-based proxy...")
             self.scraper.session_proxy = self._get_scraperapi_session_proxy()
             if not self.scraper.session_proxy:
-                print("⚠️  Falling back to direct connection")
+                logger.warning("⚠️  Falling back to direct connection")
                 self.scraper.session_proxy = None
         elif self.scraper.connection_type == "proxy":
-            print(f"🔗 Using configured proxy: {self.scraper.proxy}")
+            logger.info("🔗 Using configured proxy: %s", self.scraper.proxy)
             self.scraper.session_proxy = self.scraper.proxy
         else:
-            print("🌐 Using direct connection")
+            logger.info("🌐 Using direct connection")
             self.scraper.session_proxy = None
 
         return self.scraper.session_proxy
@@ -83,15 +108,15 @@ class SessionManager:
         """Verify user is logged in"""
         try:
             self.scraper.driver.find_element(By.XPATH, "//a[contains(@href, 'watchlist')]")
-            print("✅ Successfully authenticated")
+            logger.info("✅ Successfully authenticated")
             return True
         except Exception:
-            print("⚠️  Not authenticated - some data may be limited")
+            logger.warning("⚠️  Not authenticated - some data may be limited")
             return False
 
     def start_session(self):
         """Start browser session with proxy and authentication"""
-        print("🚀 Starting enhanced stealth browser session...")
+        logger.info("🚀 Starting enhanced stealth browser session...")
 
         # Setup session-based proxy (ScraperAPI or regular proxy)
         session_proxy = self._setup_session_proxy()
@@ -102,14 +127,14 @@ class SessionManager:
 
         if session_proxy:
             if self.scraper.connection_type == "scraperapi":
-                print(f"🌍 Using ScraperAPI with country: {self.scraper.scraperapi_country}")
-                print(f"📡 Session-based IP (consistent for entire session)")
+                logger.info("🌍 Using ScraperAPI with country: %s", self.scraper.scraperapi_country)
+                logger.info("📡 Session-based IP (consistent for entire session)")
             else:
-                print(f"🔗 Using proxy: {session_proxy}")
+                logger.info("🔗 Using proxy: %s", session_proxy)
         else:
-            print("🌐 Direct connection (no proxy)")
+            logger.info("🌐 Direct connection (no proxy)")
 
-        print(f"🎭 Using user agent: {user_agent[:50]}...")
+        logger.info("🎭 Using user agent: %s...", self._ua_short[user_agent])
 
         self.scraper.driver.get("https://finder.startupnationcentral.org")
 
@@ -117,12 +142,12 @@ class SessionManager:
         self.extended_delay()
 
         # Manual login
-        print("👤 Please log in manually in the browser window.")
-        print("   💡 Use the appropriate user account for this session:")
+        logger.info("👤 Please log in manually in the browser window.")
+        logger.info("   💡 Use the appropriate user account for this session:")
         if self.scraper.user_type == "rate_limited":
-            print("   🔴 Rate-limited user (for odd pages)")
+            logger.info("   🔴 Rate-limited user (for odd pages)")
         elif self.scraper.user_type == "fresh":
-            print("   🟢 Fresh user (for even pages)")
+            logger.info("   🟢 Fresh user (for even pages)")
 
         input("Press Enter here after you have completed login...")
 
@@ -173,38 +198,27 @@ class SessionManager:
                     actions.move_by_offset(x_offset, y_offset)
                     actions.pause(random.uniform(0.1, 0.3))
 
-            actions.perform()
-            self.micro_delay()
-
-            # Reset mouse to safe position (center)
-            actions = ActionChains(self.scraper.driver)
-            actions.move_to_element_with_offset(
-                self.scraper.driver.find_element("tag name", "body"),
-                max_x // 2, max_y // 2
-            )
+            # Pause like micro_delay, then reset mouse to safe position (center) - all in the same chain,
+            # using viewport coordinates so no body element lookup is needed
+            actions.pause(random.uniform(0.5, 1.5))
+            actions.w3c_actions.pointer_action.move_to_location(max_x // 2, max_y // 2)
             actions.perform()
 
         except Exception as e:
             # Don't let mouse movement errors break the scraping
             if self.scraper.verbose:
-                print(f"⚠️  Mouse movement error (non-critical): {e}")
+                logger.warning("⚠️  Mouse movement error (non-critical): %s", e)
             pass
     
     # Delay methods moved from main service (exact same logic)
     def human_like_delay(self, min_delay=2, max_delay=5):
         """Phase 4: Enhanced human-like delay with configurable range"""
-        import time
-        import random
         time.sleep(random.uniform(min_delay, max_delay))
 
     def extended_delay(self):
         """Phase 4: Longer delay for sensitive operations"""
-        import time
-        import random
         time.sleep(random.uniform(5, 10))
 
     def micro_delay(self):
         """Phase 4: Short delay for quick operations"""
-        import time
-        import random
         time.sleep(random.uniform(0.5, 1.5))
@@ -3,7 +3,12 @@ State Manager for SNC Scraper
 Handles loading and saving scraper state, VC status tracking, and resume functionality
 """
 import os
+import re
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+from .json_utils import load_json, save_json
+from .log_utils import get_logger
 
 # Step 3: Import experimental resume detector (optional)
 try:
@@ -11,12 +16,45 @@ try:
 except ImportError:
     EnhancedResumeDetector = None
 
+logger = get_logger(__name__)
+
+# Current page file names carry page number, status and VC count: page_3_in_progress_4_vcs_094023.json
+PAGE_FILENAME_RE = re.compile(r'^page_(\d+)_(in_progress|completed)_(\d+)_vcs_.*\.json$')
+
+# Sidecar in the results directory caching the statuses of page files that had to be parsed
+STATUS_FILENAME = "_status.json"
+
+
+def _read_page_file(path):
+    """Parse a page file, returning None if it is corrupted"""
+    try:
+        return load_json(path)
+    except json.JSONDecodeError:
+        return None
+
 
 class StateManager:
     def __init__(self, scraper_instance):
         """Initialize state manager with reference to scraper instance"""
         self.scraper = scraper_instance
     
+    def _load_status_index(self, status_path):
+        """Load the status sidecar (empty if missing or unreadable - the directory scan rebuilds it)"""
+        try:
+            statuses = load_json(status_path)
+            return statuses if isinstance(statuses, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_status_index(self, status_path, statuses):
+        """Atomically write the status sidecar"""
+        try:
+            tmp_path = f"{status_path}.tmp"
+            save_json(tmp_path, statuses, indent=False)
+            os.replace(tmp_path, status_path)
+        except OSError as e:
+            logger.warning("⚠️  Could not save page status index: %s", e)
+    
     def load_previous_state(self):
         """
         Smart page-based state loading: Find which page to work on next
@@ -26,48 +64,109 @@ class StateManager:
             target_page = 1  # Default if no previous pages found
             completed_pages = []
             in_progress_page = None
+            found_pages = []  # (page_num, status, total_vcs) for every page file with a known status
+            
+            # Page index shared with the page helpers: page_num -> {"path", "status", "vcs", "metadata"}
+            # (only freshly parsed legacy files are added here - the page helpers fill in the rest on first load)
+            page_index = getattr(self.scraper, 'page_index', None)
+            legacy_files = []  # (filename, path, mtime_ns) of page files that have to be parsed
             
-            # Scan results directory for page JSON files
+            # Legacy file statuses parsed on earlier runs: filename -> {"mtime_ns", "page_number", "status", "total_vcs"}
+            status_path = os.path.join(self.scraper.results_dir, STATUS_FILENAME)
+            known_statuses = self._load_status_index(status_path)
+            statuses = {}
+            
+            # Scan results directory for page JSON files - status comes from the filename where possible
             if os.path.exists(self.scraper.results_dir):
-                for filename in os.listdir(self.scraper.results_dir):
-                    if filename.startswith('page_') and filename.endswith('.json'):
-                        filepath = os.path.join(self.scraper.results_dir, filename)
+                with os.scandir(self.scraper.results_dir) as entries:
+                    for entry in entries:
+                        filename = entry.name
+                        if not (filename.startswith('page_') and filename.endswith('.json')):
+                            continue
                         
-                        try:
-                            with open(filepath, 'r') as f:
-                                page_data = json.load(f)
-                            
-                            # Get status and page number from metadata
-                            if 'metadata' in page_data:
-                                metadata = page_data['metadata']
-                                page_num = metadata.get('page_number')
-                                status = metadata.get('status')
-                                total_vcs = metadata.get('total_vcs', 0)
-                                
-                                if status == 'in_progress':
-                                    in_progress_page = page_num
-                                    print(f"📋 Found in-progress page: {page_num} ({total_vcs} VCs)")
-                                elif status == 'completed':
-                                    completed_pages.append(page_num)
-                                    print(f"✅ Completed page: {page_num} ({total_vcs} VCs)")
-                            
-                        except json.JSONDecodeError:
-                            print(f"⚠️  Skipping corrupted file: {filename}")
+                        match = PAGE_FILENAME_RE.match(filename)
+                        if match:
+                            found_pages.append((int(match.group(1)), match.group(2), int(match.group(3))))
                             continue
+                        
+                        mtime_ns = entry.stat().st_mtime_ns
+                        known = known_statuses.get(filename)
+                        if known is not None and known.get("mtime_ns") == mtime_ns:
+                            statuses[filename] = known
+                            found_pages.append((known["page_number"], known["status"], known["total_vcs"]))
+                        else:
+                            legacy_files.append((filename, entry.path, mtime_ns))
+            
+            # Legacy files have to be parsed - read them concurrently when there are more than a couple
+            if len(legacy_files) > 2:
+                with ThreadPoolExecutor(max_workers=min(8, len(legacy_files))) as executor:
+                    legacy_data = list(executor.map(_read_page_file, [path for _, path, _ in legacy_files]))
+            else:
+                legacy_data = [_read_page_file(path) for _, path, _ in legacy_files]
+            
+            for (filename, path, mtime_ns), page_data in zip(legacy_files, legacy_data):
+                if page_data is None:
+                    logger.warning("⚠️  Skipping corrupted file: %s", filename)
+                    continue
+                
+                # Get status and page number from metadata
+                if 'metadata' in page_data:
+                    metadata = page_data['metadata']
+                    page_num = metadata.get('page_number')
+                    status = metadata.get('status')
+                    total_vcs = metadata.get('total_vcs', 0)
+                    found_pages.append((page_num, status, total_vcs))
+                    
+                    if page_index is not None and page_num is not None and 'vcs' in page_data:
+                        page_index.setdefault(page_num, {
+                            "path": path,
+                            "status": status or "unknown",
+                            "vcs": page_data['vcs'],
+                            "metadata": metadata,
+                        })
+                
+                else:
+                    # Legacy format - direct VC list (no status of its own, never picks the target page)
+                    page_num = status = None
+                    total_vcs = 0
+                    if isinstance(page_data, list) and page_index is not None:
+                        # Page number and status come from the filename
+                        page_num_str = filename[5:].partition('_')[0]
+                        if page_num_str.isdigit():
+                            page_index.setdefault(int(page_num_str), {
+                                "path": path,
+                                "status": "completed" if "completed" in filename else "in_progress",
+                                "vcs": page_data,
+                                "metadata": {},
+                            })
+                
+                statuses[filename] = {"mtime_ns": mtime_ns, "page_number": page_num, "status": status, "total_vcs": total_vcs}
+            
+            # Remember parsed statuses so the next start doesn't parse these files again
+            if statuses != known_statuses:
+                self._save_status_index(status_path, statuses)
+            
+            for page_num, status, total_vcs in found_pages:
+                if status == 'in_progress':
+                    in_progress_page = page_num
+                    logger.info("📋 Found in-progress page: %s (%s VCs)", page_num, total_vcs)
+                elif status == 'completed':
+                    completed_pages.append(page_num)
+                    logger.info("✅ Completed page: %s (%s VCs)", page_num, total_vcs)
             
             # Determine target page using smart logic
             if in_progress_page is not None:
                 # Continue the in-progress page
                 target_page = in_progress_page
-                print(f"🎯 Resuming in-progress page: {target_page}")
+                logger.info("🎯 Resuming in-progress page: %s", target_page)
             elif completed_pages:
                 # Start next page after highest completed
                 target_page = max(completed_pages) + 1
-                print(f"🎯 Starting new page: {target_page} (after {len(completed_pages)} completed pages)")
+                logger.info("🎯 Starting new page: %s (after %s completed pages)", target_page, len(completed_pages))
             else:
                 # No previous pages, start from page 1
                 target_page = 1
-                print("🎯 Starting fresh from page 1")
+                logger.info("🎯 Starting fresh from page 1")
             
             # Store target page in scraper for other methods to use
             self.scraper.target_page = target_page
@@ -75,7 +174,7 @@ class StateManager:
             return target_page
 
         except Exception as e:
-            print(f"❌ Error loading previous state: {e}")
+            logger.warning("❌ Error loading previous state: %s", e)
             # Default to page 1 on error
             self.scraper.target_page = 1
             return 1
@@ -95,11 +194,11 @@ class StateManager:
             Page number to resume from
         """
         if not enable_experimental or EnhancedResumeDetector is None:
-            print("💡 Using existing resume logic (experimental disabled)")
+            logger.info("💡 Using existing resume logic (experimental disabled)")
             return self.load_previous_state()  # Use existing logic
         
         try:
-            print("🔬 EXPERIMENTAL: Enhanced resume detection enabled")
+            logger.info("🔬 EXPERIMENTAL: Enhanced resume detection enabled")
             
             # Initialize experimental resume detector
             experimental_detector = EnhancedResumeDetector(
@@ -111,16 +210,16 @@ class StateManager:
             experimental_resume_point = experimental_detector.detect_resume_point_experimental()
             
             if experimental_resume_point is not None:
-                print(f"✅ EXPERIMENTAL resume successful: page {experimental_resume_point}")
+                logger.info("✅ EXPERIMENTAL resume successful: page %s", experimental_resume_point)
                 self.scraper.target_page = experimental_resume_point
                 return experimental_resume_point
             else:
-                print("🔄 EXPERIMENTAL resume failed - falling back to existing logic")
+                logger.info("🔄 EXPERIMENTAL resume failed - falling back to existing logic")
                 return self.load_previous_state()  # Fallback to existing
                 
         except Exception as e:
-            print(f"❌ EXPERIMENTAL resume error: {e}")
-            print("🔄 Falling back to existing resume logic")
+            logger.warning("❌ EXPERIMENTAL resume error: %s", e)
+            logger.info("🔄 Falling back to existing resume logic")
             return self.load_previous_state()  # Fallback to existing
     
     def get_resume_mode_status(self):
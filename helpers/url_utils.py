@@ -0,0 +1,9 @@
+"""
+URL Utilities for SNC Scraper
+Helpers for pulling identifiers out of SNC finder URLs
+"""
+
+
+def vc_id_from_url(url):
+    """Return the last path segment of a VC URL (its vc_id / slug) - the whole string if there is no '/'"""
+    return url[url.rfind('/') + 1:]
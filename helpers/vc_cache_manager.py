@@ -5,14 +5,41 @@ Provides standalone VC tracking functionality with zero impact on existing syste
 Step 1: Basic cache operations only - no integration yet.
 """
 
+import atexit
 import json
+import mmap
 import os
+import weakref
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+# orjson is optional - much faster cache load/save when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Live cache managers - one atexit hook flushes those with unsaved changes, without keeping any alive
+_live_managers = weakref.WeakSet()
+
+
+def _flush_live_managers() -> None:
+    for manager in list(_live_managers):
+        manager.flush()
+
+
+atexit.register(_flush_live_managers)
+
 
 class VCCacheManager:
-    """Manages a persistent cache of VC information for tracking scraping progress"""
+    """
+    Manages a persistent cache of VC information for tracking scraping progress
+    
+    The scraper only reads the cache (completed-set filtering, resume detection) and never
+    mutates it - populate_cache_from_results.py is the writer and calls flush() itself.
+    The exit flush is a safety net for scripts that forget to, and skips managers without changes.
+    """
     
     def __init__(self, cache_file_path: str = None):
         """Initialize cache manager with specified cache file path"""
@@ -24,14 +51,30 @@ class VCCacheManager:
         
         self.cache_file_path = cache_file_path
         self.cache_data = {}
+        # In-memory status indexes (slug sets) - kept in step with every mutator, so change cache_data only through them
+        self._completed_slugs = set()
+        self._pending_slugs = set()
+        self._failed_slugs = set()
+        self._status_sets = {
+            "completed": self._completed_slugs,
+            "pending": self._pending_slugs,
+            "failed": self._failed_slugs,
+        }
+        self._dirty = False  # Unsaved changes - mutators only touch memory, flush() writes the file
+        
+        # Ensure directory exists
+        cache_dir = os.path.dirname(self.cache_file_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        
         self._load_cache()
+        _live_managers.add(self)  # Don't lose unflushed changes on exit
     
     def _load_cache(self) -> None:
         """Load cache from file, create empty cache if file doesn't exist"""
         try:
             if os.path.exists(self.cache_file_path):
-                with open(self.cache_file_path, 'r', encoding='utf-8') as f:
-                    self.cache_data = json.load(f)
+                self.cache_data = self._read_cache_file()
                 print(f"✅ Loaded VC cache: {len(self.cache_data)} VCs from {self.cache_file_path}")
             else:
                 self.cache_data = {}
@@ -39,104 +82,199 @@ class VCCacheManager:
         except Exception as e:
             print(f"⚠️ Error loading VC cache: {e}")
             self.cache_data = {}
+        
+        for status_set in self._status_sets.values():
+            status_set.clear()
+        for slug, data in self.cache_data.items():
+            status_set = self._status_sets.get(data.get("scraping_status"))
+            if status_set is not None:
+                status_set.add(slug)
+    
+    def _set_indexed_status(self, slug: str, status: str) -> None:
+        """Move slug into the index set for status"""
+        for status_set in self._status_sets.values():
+            status_set.discard(slug)
+        self._status_sets[status].add(slug)
+    
+    def _read_cache_file(self) -> Dict:
+        """Parse the cache file - memory-mapped for orjson (parsed straight from the mapped pages, no read copy)"""
+        with open(self.cache_file_path, 'rb') as f:
+            if orjson is None or os.fstat(f.fileno()).st_size == 0:
+                return json.loads(f.read())
+            if hasattr(mmap, 'MAP_POPULATE'):
+                # Linux: fault the whole file in up front rather than page by page during parsing
+                mapped = mmap.mmap(f.fileno(), 0, flags=mmap.MAP_PRIVATE | mmap.MAP_POPULATE, prot=mmap.PROT_READ)
+            else:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+            finally:
+                mapped.close()
     
     def _save_cache(self) -> bool:
-        """Save cache to file"""
+        """Save cache to file (serialized in memory, then durably and atomically swapped in via a tmp file)"""
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.cache_file_path), exist_ok=True)
-            
-            # Save with pretty formatting
-            with open(self.cache_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.cache_data, f, indent=2, ensure_ascii=False)
+            # Compact output - the cache is machine-read, indentation only costs bytes and encoder time
+            if orjson is not None:
+                payload = orjson.dumps(self.cache_data)
+            else:
+                payload = json.dumps(self.cache_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            # Per-process tmp name so concurrent savers never share a tmp file; fsync before the swap
+            # so a crash leaves either the old or the new cache, never a truncated one
+            tmp_path = f"{self.cache_file_path}.tmp.{os.getpid()}"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.cache_file_path)
+            self._dirty = False
             return True
         except Exception as e:
             print(f"❌ Error saving VC cache: {e}")
             return False
     
+    def flush(self, force: bool = False) -> bool:
+        """
+        Write pending changes to the cache file
+        
+        Args:
+            force: Write even if nothing changed since the last save
+            
+        Returns:
+            True if the cache file is up to date
+        """
+        if not (self._dirty or force):
+            return True
+        return self._save_cache()
+    
+    @staticmethod
+    def _new_entry(slug: str, name: str, url: str, first_seen_page: Optional[int], now: str) -> Dict:
+        """Cache entry for a newly discovered (pending) VC"""
+        return {
+            "name": name,
+            "url": url,
+            "slug": slug,
+            "first_seen_page": first_seen_page,
+            "scraping_status": "pending",
+            "first_discovered": now,
+            "last_updated": now,
+            "last_scraped": None,
+            "scrape_attempts": 0,
+            "data_hash": None
+        }
+    
     def add_vc(self, slug: str, name: str, url: str, first_seen_page: int = None) -> bool:
         """Add a new VC to the cache"""
         try:
-            self.cache_data[slug] = {
-                "name": name,
-                "url": url,
-                "slug": slug,
-                "first_seen_page": first_seen_page,
-                "scraping_status": "pending",
-                "first_discovered": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "last_scraped": None,
-                "scrape_attempts": 0,
-                "data_hash": None
-            }
-            return self._save_cache()
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.cache_data[slug] = self._new_entry(slug, name, url, first_seen_page, now)
+            self._set_indexed_status(slug, "pending")
+            self._dirty = True
+            return True
         except Exception as e:
             print(f"❌ Error adding VC {slug}: {e}")
             return False
     
+    def add_vcs(self, records: List[Dict], status: str = "pending") -> int:
+        """
+        Add a batch of new VCs in one pass (one timestamp, one dirty mark for the whole batch)
+        
+        Args:
+            records: Dicts with 'slug', 'name', 'url' and optionally 'first_seen_page'
+                     (and 'scraped_at', used as the scrape time for completed VCs)
+            status: Status of the new entries - "pending" (newly discovered) or "completed" (already scraped)
+            
+        Returns:
+            Number of VCs added
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        added = 0
+        for record in records:
+            try:
+                slug = record["slug"]
+                entry = self._new_entry(slug, record["name"], record["url"], record.get("first_seen_page"), now)
+                if status == "completed":
+                    scraped_at = record.get("scraped_at") or now
+                    entry["scraping_status"] = "completed"
+                    entry["last_scraped"] = scraped_at
+                    entry["last_updated"] = scraped_at
+                self.cache_data[slug] = entry
+                self._set_indexed_status(slug, status)
+                added += 1
+            except Exception as e:
+                print(f"❌ Error adding VC {record.get('slug')}: {e}")
+        if added:
+            self._dirty = True
+        return added
+    
     def get_vc_status(self, slug: str) -> Optional[str]:
         """Get the scraping status of a VC"""
-        return self.cache_data.get(slug, {}).get("scraping_status")
+        row = self.cache_data.get(slug)
+        return row.get("scraping_status") if row is not None else None
     
     def mark_vc_completed(self, slug: str, data_hash: str = None) -> bool:
-        """Mark a VC as successfully scraped"""
-        try:
-            if slug in self.cache_data:
-                self.cache_data[slug]["scraping_status"] = "completed"
-                self.cache_data[slug]["last_scraped"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.cache_data[slug]["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                if data_hash:
-                    self.cache_data[slug]["data_hash"] = data_hash
-                return self._save_cache()
-            return False
-        except Exception as e:
-            print(f"❌ Error marking VC {slug} as completed: {e}")
+        """Mark a VC as successfully scraped (False if the slug is not in the cache)"""
+        row = self.cache_data.get(slug)
+        if row is None:
             return False
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        row["scraping_status"] = "completed"
+        row["last_scraped"] = now
+        row["last_updated"] = now
+        if data_hash:
+            row["data_hash"] = data_hash
+        self._set_indexed_status(slug, "completed")
+        self._dirty = True
+        return True
     
     def mark_vc_failed(self, slug: str) -> bool:
-        """Mark a VC as failed to scrape"""
-        try:
-            if slug in self.cache_data:
-                self.cache_data[slug]["scraping_status"] = "failed"
-                self.cache_data[slug]["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.cache_data[slug]["scrape_attempts"] += 1
-                return self._save_cache()
+        """Mark a VC as failed to scrape (False if the slug is not in the cache)"""
+        row = self.cache_data.get(slug)
+        if row is None:
             return False
-        except Exception as e:
-            print(f"❌ Error marking VC {slug} as failed: {e}")
+        row["scraping_status"] = "failed"
+        row["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        row["scrape_attempts"] = row.get("scrape_attempts", 0) + 1
+        self._set_indexed_status(slug, "failed")
+        self._dirty = True
+        return True
+    
+    def remove_vc(self, slug: str) -> bool:
+        """Remove a VC from the cache (False if the slug is not in the cache) - use instead of del cache_data[slug]"""
+        if self.cache_data.pop(slug, None) is None:
             return False
+        for status_set in self._status_sets.values():
+            status_set.discard(slug)
+        self._dirty = True
+        return True
     
     def get_pending_vcs(self) -> List[Dict]:
         """Get list of VCs that need to be scraped"""
-        return [
-            data for slug, data in self.cache_data.items() 
-            if data.get("scraping_status") == "pending"
-        ]
+        return [self.cache_data[slug] for slug in self._pending_slugs]
     
     def get_completed_vcs(self) -> List[Dict]:
         """Get list of successfully scraped VCs"""
-        return [
-            data for slug, data in self.cache_data.items() 
-            if data.get("scraping_status") == "completed"
-        ]
+        return [self.cache_data[slug] for slug in self._completed_slugs]
     
     def get_failed_vcs(self) -> List[Dict]:
         """Get list of VCs that failed to scrape"""
-        return [
-            data for slug, data in self.cache_data.items() 
-            if data.get("scraping_status") == "failed"
-        ]
+        return [self.cache_data[slug] for slug in self._failed_slugs]
     
     def is_vc_completed(self, slug: str) -> bool:
         """Check if a VC has been successfully scraped"""
-        return self.get_vc_status(slug) == "completed"
+        return slug in self._completed_slugs
+    
+    def get_completed_set(self) -> set:
+        """Get the set of completed slugs for bulk membership checks (live index - do not modify)"""
+        return self._completed_slugs
     
     def get_cache_stats(self) -> Dict:
         """Get statistics about the cache"""
         total = len(self.cache_data)
-        completed = len(self.get_completed_vcs())
-        pending = len(self.get_pending_vcs())
-        failed = len(self.get_failed_vcs())
+        completed = len(self._completed_slugs)
+        pending = len(self._pending_slugs)
+        failed = len(self._failed_slugs)
         
         return {
             "total_vcs": total,
@@ -181,6 +319,17 @@ def test_vc_cache_manager():
     )
     print(f"   Added VC 1: {'✅' if success1 else '❌'}")
     print(f"   Added VC 2: {'✅' if success2 else '❌'}")
+    added = cache_manager.add_vcs([
+        {"slug": "test-vc-3", "name": "Test VC 3", "url": "https://example.com/test-vc-3", "first_seen_page": 3},
+        {"slug": "test-vc-4", "name": "Test VC 4", "url": "https://example.com/test-vc-4"},
+    ])
+    print(f"   Batch-added VCs 3-4: {'✅' if added == 2 else '❌'}")
+    added = cache_manager.add_vcs([
+        {"slug": "test-vc-5", "name": "Test VC 5", "url": "https://example.com/test-vc-5",
+         "scraped_at": "2025-01-01 00:00:00"},
+    ], status="completed")
+    ok = added == 1 and cache_manager.is_vc_completed("test-vc-5")
+    print(f"   Batch-added completed VC 5: {'✅' if ok else '❌'}")
     
     # Test status checking
     print("\n2️⃣ Testing status checking...")
@@ -194,12 +343,17 @@ def test_vc_cache_manager():
     completed = cache_manager.mark_vc_completed("test-vc-1", "hash123")
     print(f"   Marked VC 1 as completed: {'✅' if completed else '❌'}")
     
+    # Test flushing
+    print("\n4️⃣ Testing flush...")
+    flushed = cache_manager.flush()
+    print(f"   Flushed to disk: {'✅' if flushed and os.path.exists(test_cache_path) else '❌'}")
+    
     # Test statistics
-    print("\n4️⃣ Testing statistics...")
+    print("\n5️⃣ Testing statistics...")
     cache_manager.print_cache_stats()
     
     # Test getting lists
-    print("\n5️⃣ Testing list retrieval...")
+    print("\n6️⃣ Testing list retrieval...")
     pending = cache_manager.get_pending_vcs()
     completed_list = cache_manager.get_completed_vcs()
     print(f"   Pending VCs: {len(pending)}")
@@ -5,10 +5,52 @@ Handles VC investment tab scraping logic
 import time
 import random
 import re
-import json
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+from services.scrapers.snc.helpers.json_utils import extract_json_array
+from services.scrapers.snc.helpers.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Compiled once - runs on every investment row
+AMOUNT_RE = re.compile(r'\$[\d,.]+[KMB]?')
+
+# Number of investment rows currently in the table (0 while it is missing or empty)
+INVESTMENT_ROW_COUNT_JS = (
+    "return document.querySelectorAll(\".entity-auto-scroll-data-table a[href*='/company_page/']\").length;"
+)
+
+# Everything the row parser needs from the investment table, collected in a single browser round-trip
+# (per-row find_element/get_attribute calls were one round-trip each). Each row's subtree is walked once,
+# picking spans, the bold name span, the lead-investor SVG and follow-on divs in document order.
+# Rows without a .company element are null.
+INVESTMENT_ROWS_JS = """
+return Array.from(arguments[0].querySelectorAll("a[href*='/company_page/']"), row => {
+    const company = row.querySelector('.company');
+    if (!company) return null;
+    const spans = [], followStyles = [];
+    let bold = null, svg = null;
+    for (const el of company.getElementsByTagName('*')) {
+        const tag = el.localName, style = el.getAttribute('style');
+        if (tag === 'span') {
+            const text = el.innerText;
+            spans.push(text);
+            if (bold === null && style !== null && style.includes('font-weight: 700')) bold = text;
+        } else if (tag === 'div') {
+            if (style !== null && style.includes('width:') && style.includes('7%')) followStyles.push(style);
+        } else if (tag === 'svg' && svg === null) {
+            if (el.getAttribute('fill') === '#00A96E' || (style !== null && style.includes('display:'))) svg = el;
+        }
+    }
+    return {
+        href: row.href,
+        spans: spans,
+        bold: bold,
+        text: company.innerText,
+        lead_style: svg && svg.parentElement ? svg.parentElement.getAttribute('style') : null,
+        follow_styles: followStyles
+    };
+});
+"""
 
 
 class InvestmentScraper:
@@ -16,22 +58,37 @@ class InvestmentScraper:
         """Initialize investment scraper with reference to scraper instance"""
         self.scraper = scraper_instance
     
+    def _has_investment_rows(self, timeout=3.0, poll_interval=0.5):
+        """Poll (briefly) for investment rows in the table - False if none appear within timeout seconds"""
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.scraper.driver.execute_script(INVESTMENT_ROW_COUNT_JS):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+    
     def extract_investment_data(self, vc_slug):
         """Extract investment data from investments tab - integrated from investment_extractor.py"""
-        print(f"💼 Extracting investments for: {vc_slug}")
+        # Selenium is imported on use so importing this module (e.g. for cache-only runs) stays light
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.wait import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        logger.info("💼 Extracting investments for: %s", vc_slug)
 
         # Navigate to investments tab
         investments_url = f"https://finder.startupnationcentral.org/investor_page/{vc_slug}?section=investments"
-        print(f"💼 Navigating to investment tab: {investments_url}")
+        logger.info("💼 Navigating to investment tab: %s", investments_url)
         
         self.scraper.driver.get(investments_url)
         
         # Check if navigation was successful
         final_url = self.scraper.driver.current_url
-        print(f"💼 Final URL after navigation: {final_url}")
+        logger.info("💼 Final URL after navigation: %s", final_url)
         
         if "section=investments" not in final_url:
-            print(f"⚠️  WARNING: Navigation may have failed - no 'section=investments' in final URL")
+            logger.warning("⚠️  WARNING: Navigation may have failed - no 'section=investments' in final URL")
 
         # Human-like wait and scroll
         time.sleep(random.uniform(3.0, 5.0))  # Restored proper delay
@@ -41,92 +98,77 @@ class InvestmentScraper:
         investments = []
 
         try:
-            # Wait for the investment table to load
-            wait = WebDriverWait(self.scraper.driver, 15)
-            table_container = wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, "entity-auto-scroll-data-table")))
-            if self.scraper.verbose:
-                print("✅ Found investment table container")
-
-            # Find all investment rows - they are <a> elements with company links
-            investment_rows = table_container.find_elements(By.XPATH, ".//a[contains(@href, '/company_page/')]")
-            if self.scraper.verbose:
-                print(f"📊 Found {len(investment_rows)} investment rows")
+            # Quick probe first - VCs without investments would otherwise sit out the full table wait
+            if not self._has_investment_rows():
+                logger.info("💼 No investment rows found - skipping table extraction")
+                investment_rows = []
+            else:
+                # Wait for the investment table to load
+                wait = WebDriverWait(self.scraper.driver, 15)
+                table_container = wait.until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "entity-auto-scroll-data-table")))
+                if self.scraper.verbose:
+                    logger.info("✅ Found investment table container")
+
+                # Read all investment rows in one browser call - they are <a> elements with company links
+                investment_rows = self.scraper.driver.execute_script(INVESTMENT_ROWS_JS, table_container)
+                if self.scraper.verbose:
+                    logger.info("📊 Found %s investment rows", len(investment_rows))
 
             for i, row in enumerate(investment_rows):
                 try:
                     # Extract data from the row structure we discovered
-                    company_div = row.find_element(By.CLASS_NAME, "company")
-                    spans = company_div.find_elements(By.TAG_NAME, "span")
-                    divs = company_div.find_elements(By.TAG_NAME, "div")
+                    if row is None:
+                        raise ValueError("no 'company' element in row")
+                    spans = [(text or "").strip() for text in row["spans"]]
 
                     # Extract date (first span)
-                    date = spans[0].text.strip() if len(spans) > 0 else "N/A"
+                    date = spans[0] if len(spans) > 0 else "N/A"
 
                     # Extract company name (from company div - look for bold text)
                     company_name = "N/A"
-                    try:
-                        company_name_element = company_div.find_element(By.XPATH,
-                                                                        ".//span[@style and contains(@style, 'font-weight: 700')]")
-                        company_name = company_name_element.text.strip()
-                    except:
+                    if row["bold"] is not None:
+                        company_name = row["bold"].strip()
+                    else:
                         # Fallback: extract from href
-                        href = row.get_attribute('href')
+                        href = row["href"]
                         if href:
                             company_name = href.split('/')[-1].replace('-', ' ').title()
 
                     # Extract round type (look for span with "Round" in text)
                     round_type = "N/A"
-                    for span in spans:
-                        text = span.text.strip()
-                        if "round" in text.lower() or "series" in text.lower() or "seed" in text.lower():
+                    for text in spans:
+                        lowered = text.lower()
+                        if "round" in lowered or "series" in lowered or "seed" in lowered:
                             round_type = text
                             break
 
-                    # Extract lead investor (check for green checkmark SVG)
+                    # Extract lead investor (green checkmark SVG whose parent is not display:none)
                     lead_investor = "No"
-                    try:
-                        svg_element = company_div.find_element(By.XPATH,
-                                                               ".//svg[@fill='#00A96E' or contains(@style, 'display:')]")
-                        # Check if SVG is visible (not display:none)
-                        parent_div = svg_element.find_element(By.XPATH, "./..")
-                        if "display:none" not in parent_div.get_attribute("style"):
-                            lead_investor = "Yes"
-                    except:
-                        pass
+                    if row["lead_style"] is not None and "display:none" not in row["lead_style"]:
+                        lead_investor = "Yes"
 
                     # Extract follow on (similar to lead investor)
                     follow_on = "No"
-                    try:
-                        # Look for second SVG or follow on indicator
-                        follow_divs = company_div.find_elements(By.XPATH,
-                                                                ".//div[contains(@style, 'width:') and contains(@style, '7%')]")
-                        for div in follow_divs:
-                            if "display:none" not in div.get_attribute("style"):
-                                follow_on = "Yes"
-                                break
-                    except:
-                        pass
+                    for style in row["follow_styles"]:
+                        if "display:none" not in style:
+                            follow_on = "Yes"
+                            break
 
                     # Extract total round amount (last span or from the end)
                     total_amount = "N/A"
-                    try:
-                        # Look for amount pattern in text
-                        all_text = company_div.text
-                        amount_match = re.search(r'\$[\d,.]+[KMB]?', all_text)
-                        if amount_match:
-                            total_amount = amount_match.group()
-                        else:
-                            # Fallback: get last span that might contain amount
-                            if len(spans) > 3:
-                                last_spans = spans[-2:]  # Check last 2 spans
-                                for span in last_spans:
-                                    text = span.text.strip()
-                                    if '$' in text:
-                                        total_amount = text
-                                        break
-                    except:
-                        pass
+                    # Look for amount pattern in text
+                    amount_match = AMOUNT_RE.search(row["text"] or "")
+                    if amount_match:
+                        total_amount = amount_match.group()
+                    else:
+                        # Fallback: get last span that might contain amount
+                        if len(spans) > 3:
+                            last_spans = spans[-2:]  # Check last 2 spans
+                            for text in last_spans:
+                                if '$' in text:
+                                    total_amount = text
+                                    break
 
                     investment = {
                         "date": date,
@@ -135,7 +177,7 @@ class InvestmentScraper:
                         "lead_investor": lead_investor,
                         "follow_on": follow_on,
                         "total_round_amount": total_amount,
-                        "company_url": row.get_attribute('href')
+                        "company_url": row["href"]
                     }
 
                     investments.append(investment)
@@ -143,12 +185,12 @@ class InvestmentScraper:
                     # Show progress for first 10, then every 50 (only in verbose mode)
                     if self.scraper.verbose:
                         if i < 10:
-                            print(f"  {i + 1}. {company_name} - {round_type} - {date}")
+                            logger.info("  %s. %s - %s - %s", i + 1, company_name, round_type, date)
                         elif i % 50 == 0:
-                            print(f"  ... processed {i + 1} investments ...")
+                            logger.info("  ... processed %s investments ...", i + 1)
 
                 except Exception as e:
-                    print(f"⚠️  Error extracting row {i + 1}: {e}")
+                    logger.warning("⚠️  Error extracting row %s: %s", i + 1, e)
                     continue
 
             # Extract additional graph data from JSON
@@ -159,26 +201,24 @@ class InvestmentScraper:
                 page_source = self.scraper.driver.page_source
 
                 # Extract Investment Rounds by Sector
-                sector_match = re.search(r'"investmentRoundsBySector":\[(.*?)\]', page_source, re.DOTALL)
-                if sector_match:
-                    sector_json = '[' + sector_match.group(1) + ']'
-                    investment_rounds_by_sector = json.loads(sector_json)
+                sectors = extract_json_array(page_source, "investmentRoundsBySector")
+                if sectors is not None:
+                    investment_rounds_by_sector = sectors
                     if self.scraper.verbose:
-                        print(f"✅ Extracted {len(investment_rounds_by_sector)} investment sectors")
+                        logger.info("✅ Extracted %s investment sectors", len(investment_rounds_by_sector))
 
                 # Extract Investment Rounds by Type
-                type_match = re.search(r'"investmentsRoundsByRoundType":\[(.*?)\]', page_source, re.DOTALL)
-                if type_match:
-                    type_json = '[' + type_match.group(1) + ']'
-                    investment_rounds_by_type = json.loads(type_json)
+                round_types = extract_json_array(page_source, "investmentsRoundsByRoundType")
+                if round_types is not None:
+                    investment_rounds_by_type = round_types
                     if self.scraper.verbose:
-                        print(f"✅ Extracted {len(investment_rounds_by_type)} investment round types")
+                        logger.info("✅ Extracted %s investment round types", len(investment_rounds_by_type))
 
             except Exception as e:
-                print(f"⚠️  Error extracting graph data: {e}")
+                logger.warning("⚠️  Error extracting graph data: %s", e)
 
             if self.scraper.verbose:
-                print(f"✅ Successfully extracted {len(investments)} investments + graph data")
+                logger.info("✅ Successfully extracted %s investments + graph data", len(investments))
 
             return {
                 "investments": investments,
@@ -192,14 +232,14 @@ class InvestmentScraper:
             }
 
         except Exception as e:
-            print(f"❌ INVESTMENT SCRAPING FAILED for {vc_slug}")
-            print(f"❌ Error: {e}")
-            print(f"❌ Final URL: {self.scraper.driver.current_url}")
-            print(f"❌ Page title: {self.scraper.driver.title}")
+            logger.warning("❌ INVESTMENT SCRAPING FAILED for %s", vc_slug)
+            logger.warning("❌ Error: %s", e)
+            logger.warning("❌ Final URL: %s", self.scraper.driver.current_url)
+            logger.warning("❌ Page title: %s", self.scraper.driver.title)
             
             # Save page source for debugging
             if self.scraper.verbose:
-                print(f"❌ Page source (first 500 chars): {self.scraper.driver.page_source[:500]}")
+                logger.warning("❌ Page source (first 500 chars): %s", self.scraper.driver.page_source[:500])
             
             return {
                 "investments": [],
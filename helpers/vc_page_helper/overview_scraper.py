@@ -3,23 +3,59 @@ Overview Scraper for SNC Scraper
 Handles VC overview tab scraping logic
 """
 import time
-import re
-import json
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
-from services.scrapers.snc.helpers.session_manager import SessionManager
+from services.scrapers.snc.helpers.json_utils import extract_json_array
+from services.scrapers.snc.helpers.log_utils import get_logger
+from services.scrapers.snc.helpers.url_utils import vc_id_from_url
+
+logger = get_logger(__name__)
+
+# Blured profile values, in page order: Israeli portfolio, exits, AUM, funds, investment stages
+BLURED_VALUES_XPATH = "//text[@class='blured-for-logged-out-users']"
+
+# Website + social hrefs - links inside their container win over matches elsewhere on the page
+SOCIAL_LINKS_JS = """
+const pick = (containerId, selector) => {
+    const element = document.querySelector('#' + containerId + ' ' + selector) || document.querySelector(selector);
+    return element ? element.href : null;
+};
+return {
+    website: pick('social-links-website-container', 'a#social-links-website'),
+    linkedin: pick('social-links-icons-container', "a[href*='linkedin.com']"),
+    facebook: pick('social-links-icons-container', "a[href*='facebook.com']"),
+    twitter: pick('social-links-icons-container', "a[href*='twitter.com']")
+};
+"""
 
 
 class OverviewScraper:
     def __init__(self, scraper_instance):
         """Initialize overview scraper with reference to scraper instance"""
         self.scraper = scraper_instance
+        self._session_manager = None  # Created on first scrape, then reused for every VC
+    
+    @property
+    def session_manager(self):
+        """SessionManager for delays and human behavior (imported on first use - it pulls in Selenium)"""
+        if self._session_manager is None:
+            from services.scrapers.snc.helpers.session_manager import SessionManager
+            self._session_manager = SessionManager(self.scraper)
+        return self._session_manager
+    
+    def _blured_value(self, blured_values, position, fallback_xpaths):
+        """Blured value at position, or the first direct-match selector that hits if the page has fewer values"""
+        if position < len(blured_values):
+            return blured_values[position]
+        return self.scraper.extract_data_safely(fallback_xpaths)
     
     def scrape_investor_overview(self, url):
         """Extract comprehensive overview data from investor page with robust selectors"""
-        print(f"📊 Scraping: {url}")
+        # Selenium is imported on use so importing this module stays light
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.wait import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        logger.info("📊 Scraping: %s", url)
         
         # Check if we're already on the correct page (avoid unnecessary navigation)
         current_url = self.scraper.driver.current_url
@@ -27,22 +63,22 @@ class OverviewScraper:
         current_path = current_url.split('?')[0]
         
         if current_path != expected_path:
-            print(f"📊 Navigating to overview page: {url}")
+            logger.info("📊 Navigating to overview page: %s", url)
+            self.scraper.rate_limiter.acquire()  # Tabs opened by the scraper already took their token
             self.scraper.driver.get(url)
         else:
-            print(f"📊 Already on correct page, skipping navigation")
+            logger.info("📊 Already on correct page, skipping navigation")
             
         # Use session manager for delays and human behavior
-        session_manager = SessionManager(self.scraper)
-        session_manager.human_like_delay()
-        session_manager.human_scroll()
+        self.session_manager.human_like_delay()
+        self.session_manager.human_scroll()
 
         wait = WebDriverWait(self.scraper.driver, 20)
         try:
             # Wait for main heading (investor name)
             name = wait.until(EC.presence_of_element_located((By.TAG_NAME, "h1"))).text.strip()
             if self.scraper.verbose:
-                print("Found name:", name)
+                logger.info("Found name: %s", name)
 
             # Extract the 12 specific fields based on ACTUAL HTML structure
 
@@ -52,7 +88,7 @@ class OverviewScraper:
                 "//div[contains(text(), 'OurCrowd is a global investment platform')]"
             ])
             if self.scraper.verbose:
-                print("Found overview:", overview)
+                logger.info("Found overview: %s", overview)
 
             # 2. Founded - CORRECTED SELECTOR
             founded = self.scraper.extract_data_safely([
@@ -61,83 +97,70 @@ class OverviewScraper:
                 "//h3[text()='Founded']/following-sibling::*//text"
             ])
             if self.scraper.verbose:
-                print("Found founded:", founded)
+                logger.info("Found founded: %s", founded)
 
             # Note: Investment rounds data extracted in investments tab
 
+            # Fields 5-9 are the 1st-5th blured values - look them all up once, then pick by position
+            try:
+                blured_values = [element.text.strip() for element in
+                                 self.scraper.driver.find_elements(By.XPATH, BLURED_VALUES_XPATH)]
+            except Exception:
+                blured_values = []
+
             # 5. Israeli portfolio companies - DIRECT SELECTOR (position-based)
-            israeli_portfolio = self.scraper.extract_data_safely([
-                "(//text[@class='blured-for-logged-out-users'])[1]",  # First blured element is 254
+            israeli_portfolio = self._blured_value(blured_values, 0, [  # First blured element is 254
                 "//text[@class='blured-for-logged-out-users' and text()='254']",  # Direct value match
                 "//div[@class='entity-profile-labled-data-text-container']//text[@class='blured-for-logged-out-users' and text()='254']"
             ])
             if self.scraper.verbose:
-                print("Found israeli_portfolio:", israeli_portfolio)
+                logger.info("Found israeli_portfolio: %s", israeli_portfolio)
 
             # 6. Exits - DIRECT SELECTOR (position-based)
-            exits = self.scraper.extract_data_safely([
-                "(//text[@class='blured-for-logged-out-users'])[2]",  # Second blured element is 51
+            exits = self._blured_value(blured_values, 1, [  # Second blured element is 51
                 "//text[@class='blured-for-logged-out-users' and text()='51']",  # Direct value match
                 "//div[@class='entity-profile-labled-data-text-container']//text[@class='blured-for-logged-out-users' and text()='51']"
             ])
             if self.scraper.verbose:
-                print("Found exits:", exits)
+                logger.info("Found exits: %s", exits)
 
             # 7. Assets under management - DIRECT SELECTOR (position-based)
-            aum = self.scraper.extract_data_safely([
-                "(//text[@class='blured-for-logged-out-users'])[3]",  # Third blured element is $2.35B
+            aum = self._blured_value(blured_values, 2, [  # Third blured element is $2.35B
                 "//text[@class='blured-for-logged-out-users' and text()='$2.35B']",  # Direct value match
                 "//div[@class='entity-profile-labled-data-text-container']//text[@class='blured-for-logged-out-users' and contains(text(), '$') and contains(text(), 'B')]"
             ])
             if self.scraper.verbose:
-                print("Found aum:", aum)
+                logger.info("Found aum: %s", aum)
 
             # 8. Funds - DIRECT SELECTOR (position-based)
-            funds = self.scraper.extract_data_safely([
-                "(//text[@class='blured-for-logged-out-users'])[4]",  # Fourth blured element is 42
+            funds = self._blured_value(blured_values, 3, [  # Fourth blured element is 42
                 "//text[@class='blured-for-logged-out-users' and text()='42']",  # Direct value match
                 "//div[@class='entity-profile-labled-data-text-container']//text[@class='blured-for-logged-out-users' and text()='42']"
             ])
             if self.scraper.verbose:
-                print("Found funds:", funds)
+                logger.info("Found funds: %s", funds)
 
             # 9. Target investment stages - DIRECT SELECTOR (position-based)
-            investment_stages = self.scraper.extract_data_safely([
-                "(//text[@class='blured-for-logged-out-users'])[5]",  # Fifth blured element is stages
+            investment_stages = self._blured_value(blured_values, 4, [  # Fifth blured element is stages
                 "//text[@class='blured-for-logged-out-users' and contains(text(), 'Early stage')]",
                 # Direct value match
                 "//div[@class='entity-profile-labled-data-text-container']//text[@class='blured-for-logged-out-users' and contains(text(), 'stage')]"
             ])
             if self.scraper.verbose:
-                print("Found investment_stages:", investment_stages)
-
-            # 10. Web & social links - FIXED SELECTORS
-            website = self.scraper.extract_data_safely([
-                "//div[@id='social-links-website-container']//a[@id='social-links-website']/@href",
-                "//a[@id='social-links-website']/@href"
-            ])
+                logger.info("Found investment_stages: %s", investment_stages)
 
-            linkedin = self.scraper.extract_data_safely([
-                "//div[@id='social-links-icons-container']//a[contains(@href, 'linkedin.com')]/@href",
-                "//a[contains(@href, 'linkedin.com')]/@href"
-            ])
-            facebook = self.scraper.extract_data_safely([
-                "//div[@id='social-links-icons-container']//a[contains(@href, 'facebook.com')]/@href",
-                "//a[contains(@href, 'facebook.com')]/@href"
-            ])
-            twitter = self.scraper.extract_data_safely([
-                "//div[@id='social-links-icons-container']//a[contains(@href, 'twitter.com')]/@href",
-                "//a[contains(@href, 'twitter.com')]/@href"
-            ])
-
-            web_social_links = {
-                "website": website,
-                "linkedin": linkedin,
-                "facebook": facebook,
-                "twitter": twitter
-            }
+            # 10. Web & social links - FIXED SELECTORS (all four hrefs in one script call)
+            try:
+                social_hrefs = self.scraper.driver.execute_script(SOCIAL_LINKS_JS)
+            except Exception:
+                social_hrefs = {}
+
+            web_social_links = {}
+            for key in ("website", "linkedin", "facebook", "twitter"):
+                href = social_hrefs.get(key)
+                web_social_links[key] = href if href is not None else "N/A"
             if self.scraper.verbose:
-                print("Found web_social_links:", web_social_links)
+                logger.info("Found web_social_links: %s", web_social_links)
 
             # 11. Locations - FIXED SELECTORS
             locations = []
@@ -147,7 +170,7 @@ class OverviewScraper:
                                                               "//div[@id='entity-location-desktop-container']//div[@class='entity-location-address-container']")
                 locations = [elem.text.strip() for elem in location_elements if elem.text.strip()]
                 if self.scraper.verbose:
-                    print("Found locations:", locations)
+                    logger.info("Found locations: %s", locations)
             except:
                 locations = []
 
@@ -156,23 +179,21 @@ class OverviewScraper:
             try:
                 # Extract industry data from JSON embedded in page
                 page_source = self.scraper.driver.page_source
-                sector_match = re.search(r'"investmentRoundsBySector":\[(.*?)\]', page_source, re.DOTALL)
-                if sector_match:
-                    sectors_json = '[' + sector_match.group(1) + ']'
-                    sectors_data = json.loads(sectors_json)
+                sectors_data = extract_json_array(page_source, "investmentRoundsBySector")
+                if sectors_data is not None:
                     industries = [sector['sector'] for sector in sectors_data if sector.get('sector')]
                     if self.scraper.verbose:
-                        print("Found industries from JSON:", industries)
+                        logger.info("Found industries from JSON: %s", industries)
                 else:
                     if self.scraper.verbose:
-                        print("No industry data found in JSON")
+                        logger.info("No industry data found in JSON")
             except Exception as e:
                 if self.scraper.verbose:
-                    print(f"Error extracting industries from JSON: {e}")
+                    logger.info("Error extracting industries from JSON: %s", e)
                 industries = []
 
             # Extract VC ID from URL
-            vc_id = url.split('/')[-1] if '/' in url else url
+            vc_id = vc_id_from_url(url)
 
             return {
                 'vc_id': vc_id,
@@ -192,6 +213,6 @@ class OverviewScraper:
             }
 
         except Exception as e:
-            print(f"❌ Error scraping {url}: {e}")
-            print("Page source (first 2000 chars):\n", self.scraper.driver.page_source[:2000])
+            logger.warning("❌ Error scraping %s: %s", url, e)
+            logger.info("Page source (first 2000 chars):\n %s", self.scraper.driver.page_source[:2000])
             return None
\ No newline at end of file
@@ -4,6 +4,30 @@ Main VC scraping flow controller - orchestrates overview and investment tab scra
 """
 from services.scrapers.snc.helpers.vc_page_helper.investment_scraper import InvestmentScraper
 from services.scrapers.snc.helpers.vc_page_helper.overview_scraper import OverviewScraper
+import logging
+
+from services.scrapers.snc.helpers.log_utils import get_logger
+from services.scrapers.snc.helpers.url_utils import vc_id_from_url
+
+logger = get_logger(__name__)
+
+# Page text markers for VCs that are not scraped: (lowercase needle, status, name, reason) - checked in order
+SENTINELS = (
+    ("presumed inactive no recent investments in israel", 'inactive',
+     'Inactive VC (Not Scraped)', 'PRESUMED INACTIVE No recent investments in Israel'),
+    ("this profile has limited information", 'limited_info',
+     'Limited Info VC (Not Scraped)', 'This profile has limited information'),
+)
+
+# Index of the first sentinel found in the page text (-1 if none) - searched in the browser so only
+# a number crosses the driver connection instead of the serialized page
+VALIDATION_JS = """
+const text = document.documentElement.textContent.toLowerCase();
+for (let i = 0; i < arguments.length; i++) {
+    if (text.includes(arguments[i])) return i;
+}
+return -1;
+"""
 
 
 class VCOrchestrator:
@@ -15,72 +39,78 @@ class VCOrchestrator:
 
     def scrape_investor_complete_with_investments(self, url):
         """Complete VC scraping: Overview tab → Investments tab → Exit with status tracking and rate limit detection"""
-        vc_id = url.split('/')[-1] if '/' in url else url
+        vc_id = vc_id_from_url(url)
 
         # Check if already completed
         if self.scraper._get_vc_status(vc_id) == "completed":
-            self.scraper._verbose_print(f"🔄 VC {vc_id} already completed - skipping")
+            logger.debug("🔄 VC %s already completed - skipping", vc_id)
             return None
 
         # Mark as in progress
         self.scraper._set_vc_status(vc_id, "in_progress", url)
-        print(f"🏢 === SCRAPING VC: {vc_id} ===")
+        logger.info("🏢 === SCRAPING VC: %s ===", vc_id)
 
         # Step 1: Check for rate limits immediately
         if self.scraper.detect_rate_limit():
-            print(f"🚨 RATE LIMIT DETECTED on {vc_id} - stopping gracefully")
+            logger.warning("🚨 RATE LIMIT DETECTED on %s - stopping gracefully", vc_id)
             self.scraper._set_vc_status(vc_id, "failed")  # Mark as failed due to rate limit
             self.scraper.rate_limit_detected = True
+            self.scraper.rate_limiter.drain(self.scraper.rate_limit_cooldown)  # Hold further requests
             return None
 
         # NEW: Step 1.5: Early validation - check for problematic VC types
         validation_result = self._validate_vc_page(vc_id)
         if validation_result['status'] != 'valid':
-            print(f"⚠️ VC {vc_id} is {validation_result['status']}: {validation_result['reason']}")
+            logger.info("⚠️ VC %s is %s: %s", vc_id, validation_result['status'], validation_result['reason'])
             return validation_result  # Return status object instead of None
 
         # Step 2: Extract Overview tab data (already on page from tab opening)
-        print("📊 Step 1: Extracting Overview data...")
+        logger.debug("📊 Step 1: Extracting Overview data...")
         overview_data = self.overview_scraper.scrape_investor_overview(url)
         if not overview_data:
-            print("❌ Failed to extract overview data - skipping VC")
+            logger.warning("❌ Failed to extract overview data - skipping VC")
             self.scraper._set_vc_status(vc_id, "failed")  # Mark as failed
             return None
 
         # Step 2: Extract VC slug for investments URL (handle query parameters)
-        vc_slug = url.split('?')[0].split('/')[-1] if '/' in url else url
-        print(f"💼 VC slug extracted: {vc_slug}")
-        print(
-            f"💼 Investment URL will be: https://finder.startupnationcentral.org/investor_page/{vc_slug}?section=investments")
+        vc_slug = vc_id if '?' not in url else vc_id_from_url(url.partition('?')[0])
+        logger.debug("💼 VC slug extracted: %s", vc_slug)
+        logger.debug("💼 Investment URL will be: https://finder.startupnationcentral.org/investor_page/%s?section=investments",
+                     vc_slug)
 
         # Step 3: Extract Investments tab data
-        print("💼 Step 2: Extracting Investment data...")
+        logger.debug("💼 Step 2: Extracting Investment data...")
+        self.scraper.rate_limiter.acquire()  # Investments tab is another page load
         investment_data = self.investment_scraper.extract_investment_data(vc_slug)
 
-        # Step 4: Combine all data into final structure
-        complete_data = {
-            # Overview data
-            **overview_data,
+        # Counted before the investment keys are merged in (only needed for the debug breakdown below)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        filled_fields = sum(1 for v in overview_data.values() if v != 'N/A') if debug else 0
+
+        # Step 4: Combine all data into final structure - overview_data is ours, so extend it in place
+        complete_data = overview_data
+        complete_data.update({
             # Investment data
             "investments": investment_data["investments"],
             "investment_rounds_by_sector_detailed": investment_data["investment_rounds_by_sector"],
             "investment_rounds_by_type_detailed": investment_data["investment_rounds_by_type"],
             "investment_summary": investment_data["summary"]
-        }
+        })
 
         # Step 5: Mark as completed and update tracking
         self.scraper._set_vc_status(vc_id, "completed", url)
-        self.scraper.scraped_urls.add(url)
-        self.scraper.scraped_vc_ids.add(vc_id)
         self.scraper.scraped_count += 1
 
-        print(f"✅ Step 3: Completed VC {self.scraper.scraped_count}: {overview_data['name']}")
-        print(f"   - Overview: ✅ ({len([k for k, v in overview_data.items() if v != 'N/A'])}/15 fields)")
-        print(f"   - Investments: ✅ ({investment_data['summary']['total_investments']} investments)")
-        print(
-            f"   - Graph data: ✅ ({investment_data['summary']['total_sectors']} sectors, {investment_data['summary']['total_round_types']} round types)")
-        print(f"🔄 Status: completed (Total: {len(self.scraper._get_completed_vcs())} completed VCs)")
-        print(f"🏢 === COMPLETED: {overview_data['name']} ===\n")
+        logger.info("✅ Step 3: Completed VC %s: %s", self.scraper.scraped_count, complete_data['name'])
+        # Per-VC breakdown counts fields and walks every VC status - only built when debug output is on
+        if debug:
+            summary = investment_data['summary']
+            logger.debug("   - Overview: ✅ (%s/15 fields)", filled_fields)
+            logger.debug("   - Investments: ✅ (%s investments)", summary['total_investments'])
+            logger.debug("   - Graph data: ✅ (%s sectors, %s round types)",
+                         summary['total_sectors'], summary['total_round_types'])
+            logger.debug("🔄 Status: completed (Total: %s completed VCs)", len(self.scraper._get_completed_vcs()))
+        logger.info("🏢 === COMPLETED: %s ===\n", complete_data['name'])
 
         return complete_data
     
@@ -96,32 +126,24 @@ class VCOrchestrator:
             dict: Validation result with status and reason
         """
         try:
-            # Get current page source
-            page_source = self.scraper.driver.page_source.lower()
-            
-            # Check for inactive VC indicator
-            if "presumed inactive no recent investments in israel" in page_source:
-                return {
-                    'status': 'inactive',
-                    'name': 'Inactive VC (Not Scraped)',
-                    'vc_id': vc_id,
-                    'url': self.scraper.driver.current_url,
-                    'reason': 'PRESUMED INACTIVE No recent investments in Israel',
-                    'validation_type': 'inactive',
-                    'scraped_at': '',
-                    'overview': '',
-                    'investments': []
-                }
+            # Check for inactive / limited information indicators in the browser
+            try:
+                found = self.scraper.driver.execute_script(VALIDATION_JS, *(sentinel[0] for sentinel in SENTINELS))
+            except Exception as e:
+                # Fall back to searching the page source here
+                logger.debug("⚠️ In-page validation failed (%s) - checking page source", e)
+                page_source = self.scraper.driver.page_source.lower()
+                found = next((i for i, sentinel in enumerate(SENTINELS) if sentinel[0] in page_source), -1)
             
-            # Check for limited information indicator  
-            if "this profile has limited information" in page_source:
+            if found >= 0:
+                needle, status, name, reason = SENTINELS[found]
                 return {
-                    'status': 'limited_info',
-                    'name': 'Limited Info VC (Not Scraped)',
+                    'status': status,
+                    'name': name,
                     'vc_id': vc_id,
                     'url': self.scraper.driver.current_url,
-                    'reason': 'This profile has limited information',
-                    'validation_type': 'limited_info',
+                    'reason': reason,
+                    'validation_type': status,
                     'scraped_at': '',
                     'overview': '',
                     'investments': []
@@ -137,7 +159,7 @@ class VCOrchestrator:
             }
             
         except Exception as e:
-            print(f"❌ Error validating VC page for {vc_id}: {e}")
+            logger.error("❌ Error validating VC page for %s: %s", vc_id, e)
             # On error, assume valid to continue with scraping
             return {
                 'status': 'valid',
@@ -1,19 +1,24 @@
 #!/usr/bin/env python3
 """
 Simple CSV to JSON Converter for SNC Investor Data
-Converts all CSV files in investor_list_csvs/ to unified JSON
+Converts all CSV files in investor_list_csvs/ to unified JSON (or NDJSON with --stream)
 """
 
+import argparse
 import csv
 import json
 import os
 import glob
+from concurrent.futures import ProcessPoolExecutor
 
 
 def clean_excel_format(value):
     """Remove Excel formatting like ="value" and return clean string"""
     if not value:
         return ""
+    # Fast path for the common ="value" cell - it starts and ends with non-space characters, so nothing to strip
+    if isinstance(value, str) and value.startswith('="') and value.endswith('"'):
+        return value[2:-1]
     # Remove Excel quotes and equals formatting
     cleaned = str(value).strip()
     if cleaned.startswith('="') and cleaned.endswith('"'):
@@ -26,47 +31,99 @@ def extract_vc_id_from_url(url):
     if not url:
         return None
     # Get the last part of URL after final slash
-    return url.rstrip('/').split('/')[-1]
+    return url.rstrip('/').rpartition('/')[2]
 
 
-def process_csv_file(csv_path):
-    """Process single CSV file and return VC data dictionary"""
-    vcs = {}
+# Output field -> CSV column, in output order
+FIELD_COLUMNS = (
+    ('name', 'Name'),
+    ('url', 'Finder URL'),
+    ('type', 'Type'),
+    ('investment_stage', 'Investment Stage'),
+    ('investments', 'Investments'),
+    ('il_investments_2y', 'IL investments in past 2Y'),
+    ('managed_assets', 'Managed Assets'),
+    ('investment_range', 'Investment Range'),
+)
+
+
+def iter_csv_vcs(csv_path):
+    """Yield (vc_id, vc_data) for each VC row of a single CSV file, one row at a time"""
+    count = 0
     
     try:
         with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, [])
+            
+            # Validate the header once - every expected column must be present
+            missing = [column for _, column in FIELD_COLUMNS if column not in header]
+            if missing:
+                raise ValueError(f"missing columns: {', '.join(missing)}")
+            
+            # Resolve column positions once (last occurrence wins, as with csv.DictReader)
+            positions = {column: i for i, column in enumerate(header)}
+            fields = tuple(field for field, _ in FIELD_COLUMNS)
+            column_indexes = tuple(positions[column] for _, column in FIELD_COLUMNS)
+            url_index = positions['Finder URL']
+            url_slot = fields.index('url')
+            width = max(column_indexes) + 1
             
             for row in reader:
-                # Clean all values from Excel formatting
-                cleaned_row = {key: clean_excel_format(value) for key, value in row.items()}
+                # Skip rows without a URL before cleaning anything
+                if url_index >= len(row) or not row[url_index]:
+                    continue
+                if len(row) < width:
+                    row += [''] * (width - len(row))  # Short rows read as empty trailing cells
+                
+                # Clean only the emitted values from Excel formatting
+                values = [clean_excel_format(row[i]) for i in column_indexes]
                 
                 # Extract VC ID from URL
-                finder_url = cleaned_row.get('Finder URL', '')
+                finder_url = values[url_slot]
                 vc_id = extract_vc_id_from_url(finder_url)
                 
                 if vc_id and finder_url:
-                    vcs[vc_id] = {
-                        'name': cleaned_row.get('Name', ''),
-                        'url': finder_url,
-                        'type': cleaned_row.get('Type', ''),
-                        'investment_stage': cleaned_row.get('Investment Stage', ''),
-                        'investments': cleaned_row.get('Investments', ''),
-                        'il_investments_2y': cleaned_row.get('IL investments in past 2Y', ''),
-                        'managed_assets': cleaned_row.get('Managed Assets', ''),
-                        'investment_range': cleaned_row.get('Investment Range', '')
-                    }
+                    count += 1
+                    yield vc_id, dict(zip(fields, values))
                     
-        print(f"✅ Processed {csv_path}: {len(vcs)} VCs")
+        print(f"✅ Processed {csv_path}: {count} VCs")
         
     except Exception as e:
         print(f"❌ Error processing {csv_path}: {e}")
-        
-    return vcs
 
 
-def process_all_csvs():
-    """Process all CSV files and create unified JSON"""
+def process_csv_file(csv_path):
+    """Process single CSV file and return VC data dictionary"""
+    return dict(iter_csv_vcs(csv_path))
+
+
+def stream_csvs_to_ndjson(csv_files, output_file):
+    """Write one {vc_id: vc_data} object per line as rows are read - only the seen VC IDs stay in memory"""
+    seen_vc_ids = set()
+    
+    with open(output_file, 'w', encoding='utf-8') as out:
+        for csv_file in csv_files:
+            print(f"📄 Processing: {os.path.basename(csv_file)}")
+            
+            for vc_id, vc_data in iter_csv_vcs(csv_file):
+                # Duplicates keep the first occurrence (already written)
+                if vc_id in seen_vc_ids:
+                    continue
+                seen_vc_ids.add(vc_id)
+                out.write(json.dumps({vc_id: vc_data}, ensure_ascii=False) + "\n")
+    
+    return len(seen_vc_ids)
+
+
+def process_all_csvs(stream=False, workers=1):
+    """
+    Process all CSV files and create unified JSON
+    
+    With stream=True rows are written straight to unified_vcs.ndjson instead of being
+    collected in memory; the number of unique VCs written is returned.
+    With workers > 1 the CSV files are parsed in that many processes (merged in file order).
+    """
     print("🚀 Starting CSV to JSON conversion...")
     
     # Find all CSV files
@@ -79,18 +136,36 @@ def process_all_csvs():
         
     print(f"📁 Found {len(csv_files)} CSV files")
     
+    if stream:
+        output_file = "unified_vcs.ndjson"
+        unique_vcs = stream_csvs_to_ndjson(csv_files, output_file)
+        
+        print(f"\n📊 SUMMARY:")
+        print(f"   📁 Processed files: {len(csv_files)}")
+        print(f"   🏢 Unique VCs found: {unique_vcs}")
+        print(f"💾 Saved unified data: {output_file}")
+        print(f"✅ Conversion complete!")
+        
+        return unique_vcs
+    
     # Process all CSV files and merge data
     unified_vcs = {}
     
-    for csv_file in csv_files:
-        filename = os.path.basename(csv_file)
-        print(f"📄 Processing: {filename}")
-        
-        vcs_data = process_csv_file(csv_file)
-        
-        # Merge into unified dictionary (duplicates will overwrite)
-        for vc_id, vc_data in vcs_data.items():
-            unified_vcs[vc_id] = vc_data
+    if workers > 1:
+        # Files are independent - parse them in parallel, results come back in file order
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for vcs_data in executor.map(process_csv_file, csv_files):
+                # Merge into unified dictionary (duplicates will overwrite)
+                unified_vcs.update(vcs_data)
+    else:
+        for csv_file in csv_files:
+            filename = os.path.basename(csv_file)
+            print(f"📄 Processing: {filename}")
+            
+            vcs_data = process_csv_file(csv_file)
+            
+            # Merge into unified dictionary (duplicates will overwrite)
+            unified_vcs.update(vcs_data)
             
     print(f"\n📊 SUMMARY:")
     print(f"   📁 Processed files: {len(csv_files)}")
@@ -109,6 +184,13 @@ def process_all_csvs():
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Convert SNC investor CSV exports to unified JSON")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream rows to unified_vcs.ndjson (one VC per line) instead of building unified_vcs.json in memory")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parse CSV files in this many processes (unified_vcs.json only; default: 1)")
+    args = parser.parse_args()
+    
     print("=" * 50)
     print("📊 SNC INVESTOR CSV TO JSON CONVERTER")
     print("=" * 50)
@@ -118,11 +200,13 @@ def main():
     os.chdir(script_dir)
     
     # Process all CSVs
-    unified_data = process_all_csvs()
+    unified_data = process_all_csvs(stream=args.stream, workers=args.workers)
     
     if unified_data:
-        print(f"\n🎉 SUCCESS: {len(unified_data)} unique VCs ready for scraping!")
-        print(f"📄 Output file: unified_vcs.json")
+        unique_vcs = unified_data if args.stream else len(unified_data)
+        output_file = "unified_vcs.ndjson" if args.stream else "unified_vcs.json"
+        print(f"\n🎉 SUCCESS: {unique_vcs} unique VCs ready for scraping!")
+        print(f"📄 Output file: {output_file}")
     else:
         print("❌ No data processed")
 
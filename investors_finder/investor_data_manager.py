@@ -6,13 +6,44 @@ Manages investor database JSON with scraping status tracking
 
 import json
 import os
-from datetime import datetime
-from typing import List, Dict, Optional
+import random
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+# orjson is optional - much faster load/save of the investor database when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_now_cache = (None, "")  # (epoch second, formatted timestamp)
+
+
+def _now_str() -> str:
+    """Current local time as "%Y-%m-%d %H:%M:%S", formatted at most once per second"""
+    global _now_cache
+    second = int(time.time())
+    if _now_cache[0] != second:
+        _now_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _now_cache[1]
 
 
 class InvestorDataManager:
     """Manages investor database with scraping status and batch selection"""
     
+    # Failed investors are retried with capped exponential backoff plus jitter, then given up on
+    RETRY_BASE_DELAY = 60  # Seconds before the first retry
+    RETRY_MAX_DELAY = 3600  # Backoff cap in seconds (jitter comes on top)
+    MAX_RETRY_ATTEMPTS = 5
+    TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+    
+    # Status changes are journaled to <database>.log as they happen (crash safety between saves);
+    # save_database() rewrites the JSON and drops the log, as does reaching COMPACT_AFTER_CHANGES changes
+    COMPACT_AFTER_CHANGES = 500
+    
     def __init__(self, database_path: str = "investor_database.json"):
         """
         Initialize investor data manager
@@ -21,12 +52,18 @@ class InvestorDataManager:
             database_path: Path to investor database JSON file
         """
         self.database_path = database_path
+        self.log_path = database_path + '.log'
         self.investors_data = {}
+        self._pending_ids = {}  # Ordered index of vc_ids that still need scraping (dict used as ordered set)
+        self._dirty = False  # True when in-memory data differs from the file
+        self._deferred = 0  # Nesting depth of deferred_save() blocks
+        self._log = None  # Append handle for the change log (opened on first change)
+        self._log_entries = 0  # Changes in the log not yet compacted into the JSON file
         self.load_database()
     
     def load_database(self) -> bool:
         """
-        Load investor database from JSON file
+        Load investor database from JSON file and replay the change log on top of it
         
         Returns:
             bool: True if loaded successfully, False otherwise
@@ -36,26 +73,137 @@ class InvestorDataManager:
                 print(f"❌ Database file not found: {self.database_path}")
                 return False
                 
-            with open(self.database_path, 'r', encoding='utf-8') as f:
-                self.investors_data = json.load(f)
+            with open(self.database_path, 'rb') as f:
+                raw = f.read()
+            self.investors_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self._log_entries = self._replay_log()
+            self._rebuild_pending_index()
+            self._dirty = bool(self._log_entries)  # Replayed changes are not in the JSON file yet
             
             print(f"✅ Loaded investor database: {len(self.investors_data)} investors")
+            if self._log_entries:
+                print(f"📝 Replayed {self._log_entries} logged changes")
             return True
             
         except Exception as e:
             print(f"❌ Error loading database: {e}")
             return False
     
-    def save_database(self) -> bool:
+    def _database_signature(self) -> Dict:
+        """Size and mtime of the JSON file - the change log records which database version it applies to"""
+        st = os.stat(self.database_path)
+        return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+    
+    def _replay_log(self) -> int:
+        """Apply logged changes to the loaded data - returns the number of entries applied"""
+        if not os.path.exists(self.log_path):
+            return 0
+        
+        applied = 0
+        with open(self.log_path, 'rb') as f:
+            # The first line names the database version the log was started on - a log left over from
+            # before the JSON was rewritten or regenerated must not be applied on top of it
+            try:
+                header = json.loads(f.readline())
+                base = header['base']
+            except (ValueError, KeyError, TypeError):
+                base = None
+            if base != self._database_signature():
+                print(f"⚠️ Ignoring stale change log {self.log_path} (database file changed since it was written)")
+                f.close()
+                os.remove(self.log_path)
+                return 0
+            
+            for line in f:
+                try:
+                    entry = orjson.loads(line) if orjson is not None else json.loads(line)
+                except ValueError:
+                    # A torn last line from an interrupted write - everything before it is intact
+                    print(f"⚠️ Skipping unreadable change log line in {self.log_path}")
+                    continue
+                self.investors_data[entry['vc_id']] = entry['data']
+                applied += 1
+        return applied
+    
+    def _open_log(self):
+        """Open the change log for appending - new logs start with the database signature header"""
+        size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+        if size:
+            with open(self.log_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+        self._log = open(self.log_path, 'ab')
+        if not size:
+            self._log.write(json.dumps({'base': self._database_signature()}).encode('utf-8') + b"\n")
+        elif torn:
+            # Terminate a torn last line so it doesn't swallow the first entry of this session
+            self._log.write(b"\n")
+    
+    def _log_change(self, vc_id: str):
+        """Append the investor's current record to the change log (compacting once it gets long)"""
+        if self._log is None:
+            self._open_log()
+        entry = {
+            'vc_id': vc_id,
+            'data': self.investors_data[vc_id],
+            'ts': _now_str()
+        }
+        if orjson is not None:
+            self._log.write(orjson.dumps(entry) + b"\n")
+        else:
+            self._log.write(json.dumps(entry, ensure_ascii=False).encode('utf-8') + b"\n")
+        self._log.flush()
+        self._log_entries += 1
+        if self._log_entries >= self.COMPACT_AFTER_CHANGES:
+            self.compact()
+    
+    def save_database(self, force: bool = False) -> bool:
         """
-        Save investor database to JSON file
+        Save investor database to JSON file (skipped when nothing changed since load/last save)
+        
+        Call at the end of a session - the JSON on disk is then current and the change log is removed.
+        
+        Args:
+            force: Write the file even if there are no unsaved changes
+            
+        Returns:
+            bool: True if saved successfully (or nothing to save), False otherwise
+        """
+        if not self._dirty and not force:
+            print("💾 Investor database unchanged - skipping save")
+            return True
+        return self.compact()
+    
+    def compact(self) -> bool:
+        """
+        Rewrite the full JSON file (atomically, via a tmp file) and remove the change log
         
         Returns:
             bool: True if saved successfully, False otherwise
         """
         try:
-            with open(self.database_path, 'w', encoding='utf-8') as f:
-                json.dump(self.investors_data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(self.investors_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.investors_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+            # The log is only removed once the new JSON is fully on disk - a crash before the swap
+            # leaves the old JSON plus its log, after it the new JSON (the stale log is then ignored)
+            tmp_path = f"{self.database_path}.tmp.{os.getpid()}"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.database_path)
+            self._dirty = False
+            
+            # Everything in the log is now in the JSON file
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+            if os.path.exists(self.log_path):
+                os.remove(self.log_path)
+            self._log_entries = 0
             
             print(f"💾 Saved investor database: {len(self.investors_data)} investors")
             return True
@@ -64,6 +212,17 @@ class InvestorDataManager:
             print(f"❌ Error saving database: {e}")
             return False
     
+    @contextmanager
+    def deferred_save(self):
+        """Group status updates and write the database once on exit (only if something changed)"""
+        self._deferred += 1
+        try:
+            yield self
+        finally:
+            self._deferred -= 1
+            if not self._deferred and self._dirty:
+                self.save_database()
+    
     def get_unscraped_investors(self, limit: int = 50) -> List[Dict]:
         """
         Get list of unscraped investors up to specified limit
@@ -75,29 +234,57 @@ class InvestorDataManager:
             List of investor dictionaries ready for scraping
         """
         unscraped_investors = []
+        deferred = 0
+        now = _now_str()
         
-        for vc_id, vc_data in self.investors_data.items():
-            # Check if investor needs scraping
-            if self._needs_scraping(vc_data):
-                # Prepare investor data for scraping
-                investor_info = {
-                    'vc_id': vc_id,
-                    'name': vc_data.get('name', ''),
-                    'url': vc_data.get('url', ''),
-                    'type': vc_data.get('type', ''),
-                    'managed_assets': vc_data.get('managed_assets', ''),
-                    'investments': vc_data.get('investments', ''),
-                    'investment_range': vc_data.get('investment_range', '')
-                }
-                unscraped_investors.append(investor_info)
-                
-                # Stop when we reach the limit
-                if len(unscraped_investors) >= limit:
-                    break
+        # Only walk the pending index - completed/inactive/limited investors are never visited
+        for vc_id in self._pending_ids:
+            vc_data = self.investors_data[vc_id]
+            # Failed investors still backing off are left for a later batch
+            if vc_data.get('next_retry_at', '') > now:
+                deferred += 1
+                continue
+            # Prepare investor data for scraping
+            investor_info = {
+                'vc_id': vc_id,
+                'name': vc_data.get('name', ''),
+                'url': vc_data.get('url', ''),
+                'type': vc_data.get('type', ''),
+                'managed_assets': vc_data.get('managed_assets', ''),
+                'investments': vc_data.get('investments', ''),
+                'investment_range': vc_data.get('investment_range', '')
+            }
+            unscraped_investors.append(investor_info)
+            
+            # Stop when we reach the limit
+            if len(unscraped_investors) >= limit:
+                break
         
         print(f"🎯 Found {len(unscraped_investors)} unscraped investors (limit: {limit})")
+        if deferred:
+            print(f"⏳ Skipped {deferred} failed investors still waiting for their retry time")
         return unscraped_investors
     
+    def _rebuild_pending_index(self):
+        """Rebuild the ordered index of investors that need scraping (database order, failed investors last)"""
+        pending = [vc_id for vc_id, vc_data in self.investors_data.items() if self._needs_scraping(vc_data)]
+        pending.sort(key=lambda vc_id: self.investors_data[vc_id].get('scraping_status') == 'failed')  # Stable
+        self._pending_ids = dict.fromkeys(pending)
+    
+    def _set_scraping_status(self, vc_id: str, status: str):
+        """Set an investor's scraping status and keep the pending index in sync"""
+        vc_data = self.investors_data[vc_id]
+        vc_data['scraping_status'] = status
+        self._dirty = True
+        if not self._needs_scraping(vc_data):
+            self._pending_ids.pop(vc_id, None)
+        elif status == 'failed':
+            # Retry failed investors after everything that has not been tried yet
+            self._pending_ids.pop(vc_id, None)
+            self._pending_ids[vc_id] = None
+        else:
+            self._pending_ids.setdefault(vc_id)
+    
     def _needs_scraping(self, vc_data: Dict) -> bool:
         """
         Determine if an investor needs scraping based on status
@@ -112,14 +299,21 @@ class InvestorDataManager:
         
         # Investors that need scraping:
         # - never scraped
-        # - failed scraping
+        # - failed scraping (until MAX_RETRY_ATTEMPTS failures - the retry time is checked at batch selection)
         # - no scraping status set
         # 
         # Investors that DON'T need scraping:
         # - completed (already scraped successfully)
         # - inactive (PRESUMED INACTIVE)
         # - limited_info (limited information profile)
-        return scraping_status in ['not_scraped', 'failed', None, '']
+        if scraping_status == 'failed':
+            return vc_data.get('retry_count', 0) < self.MAX_RETRY_ATTEMPTS
+        return scraping_status in ['not_scraped', None, '']
+    
+    def _retry_delay(self, retry_count: int) -> float:
+        """Capped exponential backoff with jitter (seconds) before the next attempt after retry_count failures"""
+        backoff = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** (retry_count - 1))
+        return backoff + random.uniform(0, self.RETRY_BASE_DELAY)
     
     def mark_investor_as_scraped(self, vc_id: str, scraped_data: Optional[Dict] = None) -> bool:
         """
@@ -138,14 +332,18 @@ class InvestorDataManager:
         
         try:
             # Update scraping status
-            self.investors_data[vc_id]['scraping_status'] = 'completed'
-            self.investors_data[vc_id]['last_scraped'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.investors_data[vc_id]['scraped_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._set_scraping_status(vc_id, 'completed')
+            now = _now_str()
+            self.investors_data[vc_id]['last_scraped'] = now
+            self.investors_data[vc_id]['scraped_at'] = now
+            self.investors_data[vc_id].pop('retry_count', None)
+            self.investors_data[vc_id].pop('next_retry_at', None)
             
             # Merge any additional scraped data
             if scraped_data:
                 self.investors_data[vc_id].update(scraped_data)
             
+            self._log_change(vc_id)
             print(f"✅ Marked {vc_id} as scraped")
             return True
             
@@ -153,13 +351,15 @@ class InvestorDataManager:
             print(f"❌ Error marking {vc_id} as scraped: {e}")
             return False
     
-    def mark_investor_as_failed(self, vc_id: str, error_message: Optional[str] = None) -> bool:
+    def mark_investor_as_failed(self, vc_id: str, error_message: Optional[str] = None,
+                                retry_after: Optional[float] = None) -> bool:
         """
-        Mark investor as failed during scraping
+        Mark investor as failed during scraping and schedule its next retry
         
         Args:
             vc_id: Investor ID
             error_message: Optional error message
+            retry_after: Optional server-provided delay in seconds (Retry-After) - overrides the backoff
             
         Returns:
             bool: True if marked successfully
@@ -169,14 +369,25 @@ class InvestorDataManager:
             return False
         
         try:
-            # Update scraping status
-            self.investors_data[vc_id]['scraping_status'] = 'failed'
-            self.investors_data[vc_id]['last_attempt'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            vc_data = self.investors_data[vc_id]
+            now = datetime.now()
+            retry_count = vc_data.get('retry_count', 0) + 1
+            delay = retry_after if retry_after is not None else self._retry_delay(retry_count)
+            
+            # Update retry bookkeeping before the status so the pending index sees the new retry_count
+            vc_data['retry_count'] = retry_count
+            vc_data['next_retry_at'] = (now + timedelta(seconds=delay)).strftime(self.TIMESTAMP_FORMAT)
+            self._set_scraping_status(vc_id, 'failed')
+            vc_data['last_attempt'] = now.strftime(self.TIMESTAMP_FORMAT)
             
             if error_message:
-                self.investors_data[vc_id]['last_error'] = error_message
+                vc_data['last_error'] = error_message
             
-            print(f"❌ Marked {vc_id} as failed")
+            self._log_change(vc_id)
+            if retry_count >= self.MAX_RETRY_ATTEMPTS:
+                print(f"❌ Marked {vc_id} as failed - giving up after {retry_count} attempts")
+            else:
+                print(f"❌ Marked {vc_id} as failed (attempt {retry_count}, retry after {vc_data['next_retry_at']})")
             return True
             
         except Exception as e:
@@ -199,10 +410,11 @@ class InvestorDataManager:
         
         try:
             # Update scraping status
-            self.investors_data[vc_id]['scraping_status'] = 'inactive'
-            self.investors_data[vc_id]['last_checked'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._set_scraping_status(vc_id, 'inactive')
+            self.investors_data[vc_id]['last_checked'] = _now_str()
             self.investors_data[vc_id]['inactive_reason'] = 'PRESUMED INACTIVE No recent investments in Israel'
             
+            self._log_change(vc_id)
             print(f"⚠️ Marked {vc_id} as inactive")
             return True
             
@@ -226,10 +438,11 @@ class InvestorDataManager:
         
         try:
             # Update scraping status
-            self.investors_data[vc_id]['scraping_status'] = 'limited_info'
-            self.investors_data[vc_id]['last_checked'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._set_scraping_status(vc_id, 'limited_info')
+            self.investors_data[vc_id]['last_checked'] = _now_str()
             self.investors_data[vc_id]['limited_reason'] = 'This profile has limited information'
             
+            self._log_change(vc_id)
             print(f"ℹ️ Marked {vc_id} as limited_info")
             return True
             
@@ -237,6 +450,34 @@ class InvestorDataManager:
             print(f"❌ Error marking {vc_id} as limited_info: {e}")
             return False
     
+    def bulk_mark(self, status_map: Dict[str, Iterable]) -> Dict[str, int]:
+        """
+        Apply many status transitions at once (in memory - call save_database() once afterwards)
+        
+        Args:
+            status_map: Status ('scraped', 'failed', 'inactive', 'limited_info') -> VC IDs.
+                        'failed' may also be a dict of VC ID -> error message.
+            
+        Returns:
+            Dictionary with the number of investors marked per status
+        """
+        markers = {
+            'scraped': self.mark_investor_as_scraped,
+            'failed': self.mark_investor_as_failed,
+            'inactive': self.mark_investor_as_inactive,
+            'limited_info': self.mark_investor_as_limited,
+        }
+        
+        counts = {}
+        for status, vc_ids in status_map.items():
+            mark = markers[status]
+            if isinstance(vc_ids, dict):
+                counts[status] = sum(1 for vc_id, detail in vc_ids.items() if mark(vc_id, detail))
+            else:
+                counts[status] = sum(1 for vc_id in vc_ids if mark(vc_id))
+        
+        return counts
+    
     def get_scraping_stats(self) -> Dict:
         """
         Get statistics about scraping progress
@@ -244,29 +485,19 @@ class InvestorDataManager:
         Returns:
             Dictionary with scraping statistics
         """
+        # One counting pass in C - any status other than the four below counts as not scraped
+        counts = Counter(vc_data.get('scraping_status') for vc_data in self.investors_data.values())
         stats = {
             'total_investors': len(self.investors_data),
-            'completed': 0,
-            'failed': 0,
-            'inactive': 0,
-            'limited_info': 0,
+            'completed': counts['completed'],
+            'failed': counts['failed'],
+            'inactive': counts['inactive'],
+            'limited_info': counts['limited_info'],
             'not_scraped': 0,
             'completion_percentage': 0.0
         }
-        
-        for vc_data in self.investors_data.values():
-            status = vc_data.get('scraping_status', 'not_scraped')
-            
-            if status == 'completed':
-                stats['completed'] += 1
-            elif status == 'failed':
-                stats['failed'] += 1
-            elif status == 'inactive':
-                stats['inactive'] += 1
-            elif status == 'limited_info':
-                stats['limited_info'] += 1
-            else:
-                stats['not_scraped'] += 1
+        stats['not_scraped'] = stats['total_investors'] - (
+            stats['completed'] + stats['failed'] + stats['inactive'] + stats['limited_info'])
         
         # Calculate completion percentage (completed out of scrapeable VCs)
         scrapeable_vcs = stats['total_investors'] - stats['inactive'] - stats['limited_info']
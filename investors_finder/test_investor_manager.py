@@ -4,15 +4,26 @@ Simple test for InvestorDataManager
 Tests core functionality to ensure it works correctly
 """
 
+import os
+import shutil
+import tempfile
+
 from investor_data_manager import InvestorDataManager
 
 
 def test_investor_manager():
-    """Test core InvestorDataManager functionality"""
+    """Test core InvestorDataManager functionality (on a temporary copy of the database)"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_path = os.path.join(tmp_dir, "investor_database.json")
+        shutil.copy("investor_database.json", database_path)
+        _run_checks(database_path)  # The copy and its change log are removed with tmp_dir
+
+
+def _run_checks(database_path):
     print("🧪 Testing InvestorDataManager...")
     
     # Initialize manager
-    manager = InvestorDataManager()
+    manager = InvestorDataManager(database_path)
     print(f"✅ Loaded {len(manager.investors_data)} investors")
     
     # Test 1: Get 10 unscraped investors
@@ -43,18 +54,18 @@ def test_investor_manager():
     print("\n--- Test 3: Save and reload ---")
     manager.save_database()
     
-    new_manager = InvestorDataManager()
+    new_manager = InvestorDataManager(database_path)
     new_stats = new_manager.get_scraping_stats()
     print(f"After reload - Stats: {new_stats['completed']} completed, {new_stats['failed']} failed")
     assert new_stats['completed'] == 3, "Completed count should persist"
     assert new_stats['failed'] == 2, "Failed count should persist"
     
-    # Test 4: Get new batch (should exclude completed but include failed for retry)
+    # Test 4: Get new batch (should exclude completed, and failed VCs until their retry time)
     print("\n--- Test 4: Get new batch (excluding completed VCs) ---")
     new_batch = new_manager.get_unscraped_investors(limit=10)
     print(f"New batch size: {len(new_batch)}")
     
-    # Verify completed VCs are excluded but failed VCs are included (for retry)
+    # Verify completed VCs are excluded and failed VCs are backing off
     completed_vc_ids = {investors[i]['vc_id'] for i in range(3)}  # First 3 marked as completed
     failed_vc_ids = {investors[i]['vc_id'] for i in range(3, 5)}  # Next 2 marked as failed
     new_vc_ids = {inv['vc_id'] for inv in new_batch}
@@ -63,10 +74,26 @@ def test_investor_manager():
     failed_overlap = failed_vc_ids.intersection(new_vc_ids)
     
     print(f"Completed VCs in new batch: {len(completed_overlap)} (should be 0)")
-    print(f"Failed VCs in new batch: {len(failed_overlap)} (should be 2 for retry)")
+    print(f"Failed VCs in new batch: {len(failed_overlap)} (should be 0 while backing off)")
     
     assert len(completed_overlap) == 0, "No completed VCs should appear in new batch"
-    assert len(failed_overlap) == 2, "Failed VCs should appear for retry"
+    assert len(failed_overlap) == 0, "Failed VCs should wait for their retry time"
+    
+    # Once the retry time has passed, failed VCs come back for retry - after the untried VCs
+    for vc_id in failed_vc_ids:
+        new_manager.investors_data[vc_id]['next_retry_at'] = ''
+    retry_batch = new_manager.get_unscraped_investors(limit=len(new_manager.investors_data))
+    retry_vc_ids = [inv['vc_id'] for inv in retry_batch]
+    assert failed_vc_ids <= set(retry_vc_ids), "Failed VCs should appear for retry after backoff"
+    assert failed_vc_ids == set(retry_vc_ids[-2:]), "Failed VCs should be retried last"
+    
+    # Test 5: Retry ceiling
+    print("\n--- Test 5: Give up after MAX_RETRY_ATTEMPTS failures ---")
+    give_up_id = investors[3]['vc_id']
+    for _ in range(new_manager.MAX_RETRY_ATTEMPTS - 1):  # Already failed once in Test 2
+        new_manager.mark_investor_as_failed(give_up_id, "Test failure", retry_after=0)
+    assert give_up_id not in {inv['vc_id'] for inv in new_manager.get_unscraped_investors(limit=10)}, \
+        "VC should not be retried after MAX_RETRY_ATTEMPTS failures"
     
     print("\n✅ All tests passed! InvestorDataManager is working correctly.")
     
@@ -5,68 +5,139 @@ Standalone script to populate the VC cache with previously scraped VCs from /res
 Step 1.5: Cache population - no integration yet, just data migration.
 """
 
-import json
+import argparse
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from helpers.json_utils import load_json
 from helpers.vc_cache_manager import VCCacheManager
 
+# ijson is optional - when installed, result files are parsed one VC record at a time instead of
+# being loaded whole (only a few fields per record are needed here)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Compiled once - result files are named page_<n>_completed_..., in-progress pages page_<n>_in_progress_...
+_PAGE_RE = re.compile(r'page_(\d+)_completed')
+_COMPLETED_IN = '_completed'
+_UNKNOWN_SHAPE = "expected a JSON array or an object with a 'vcs' array"
+
 
 def extract_page_number_from_filename(filename):
     """Extract page number from result filename"""
-    match = re.search(r'page_(\d+)_completed', filename)
+    match = _PAGE_RE.search(filename)
     return int(match.group(1)) if match else None
 
 
 def load_result_file(file_path):
-    """Load and parse a result JSON file"""
+    """
+    Load a result JSON file's VC records - direct array or {"vcs": [...]} wrapper
+    Streamed one record at a time when ijson is installed, otherwise a parsed list (None on error)
+    Streamed records raise mid-iteration on a malformed file - parse_result_file rejects it then
+    """
+    if ijson is not None:
+        return _stream_result_records(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
+        data = load_json(file_path)  # orjson when installed, parsed straight from bytes
     except Exception as e:
         print(f"❌ Error loading {file_path}: {e}")
         return None
+    # Handle metadata wrapper format (if any)
+    if isinstance(data, dict):
+        data = data.get('vcs')
+    if not isinstance(data, list):
+        print(f"❌ Error loading {file_path}: {_UNKNOWN_SHAPE}")
+        return None
+    return data
+
+
+def _stream_result_records(file_path):
+    """Yield the VC records of a result file one at a time - raises ValueError for any other shape"""
+    with open(file_path, 'rb') as f:
+        # Sniff the top-level container (first non-whitespace byte) to pick the ijson prefix
+        first = b''
+        while not first:
+            chunk = f.read(64)
+            if not chunk:
+                break
+            first = chunk.lstrip()[:1]
+        f.seek(0)
+        if first == b'[':
+            yield from ijson.items(f, 'item')
+        elif first == b'{':
+            found = []
+            yield from ijson.items(_watch_vcs_array(ijson.parse(f), found), 'vcs.item')
+            if not found:
+                raise ValueError(_UNKNOWN_SHAPE)
+        else:
+            raise ValueError(_UNKNOWN_SHAPE)
+
+
+def _watch_vcs_array(events, found):
+    """Pass ijson events through, noting in found whether the top-level 'vcs' value is an array"""
+    for prefix, event, value in events:
+        if prefix == 'vcs' and event == 'start_array':
+            found.append(True)
+        yield prefix, event, value
 
 
 def extract_vc_data_from_results(results_data, page_number, filename):
-    """Extract VC information from results data"""
-    vcs = []
-    
-    # Handle direct array format (like the files we saw)
-    if isinstance(results_data, list):
-        for vc_data in results_data:
-            if isinstance(vc_data, dict) and 'vc_id' in vc_data:
-                vc_info = {
-                    'slug': vc_data['vc_id'],
-                    'name': vc_data.get('name', 'Unknown'),
-                    'url': vc_data.get('url', ''),
-                    'page_number': page_number,
-                    'scraped_at': vc_data.get('scraped_at', ''),
-                    'source_file': filename
-                }
-                vcs.append(vc_info)
+    """Yield VC information from the VC records returned by load_result_file"""
+    for vc_data in results_data:
+        if isinstance(vc_data, dict) and 'vc_id' in vc_data:
+            yield {
+                'slug': vc_data['vc_id'],
+                'name': vc_data.get('name', 'Unknown'),
+                'url': vc_data.get('url', ''),
+                'page_number': page_number,
+                'scraped_at': vc_data.get('scraped_at', ''),
+                'source_file': filename
+            }
+
+
+def parse_result_file(file_path):
+    """Parse one result file into (filename, page_number, VC info list) - top-level so it can run in a worker process"""
+    filename = os.path.basename(file_path)
+    page_number = extract_page_number_from_filename(filename)
+    if page_number is None:
+        return filename, None, None
+    results_data = load_result_file(file_path)
+    if results_data is None:
+        return filename, page_number, None
+    try:
+        # Streamed records fail mid-file on bad input - drop the whole file, as a failed full load does
+        return filename, page_number, list(extract_vc_data_from_results(results_data, page_number, filename))
+    except Exception as e:
+        print(f"❌ Error loading {file_path}: {e}")
+        return filename, page_number, None
+
+
+def iter_parsed_result_files(file_paths, workers=1):
+    """
+    Yield (filename, page_number, vcs) for each result file, in order
     
-    # Handle metadata wrapper format (if any)
-    elif isinstance(results_data, dict):
-        if 'vcs' in results_data and isinstance(results_data['vcs'], list):
-            for vc_data in results_data['vcs']:
-                if isinstance(vc_data, dict) and 'vc_id' in vc_data:
-                    vc_info = {
-                        'slug': vc_data['vc_id'],
-                        'name': vc_data.get('name', 'Unknown'),
-                        'url': vc_data.get('url', ''),
-                        'page_number': page_number,
-                        'scraped_at': vc_data.get('scraped_at', ''),
-                        'source_file': filename
-                    }
-                    vcs.append(vc_info)
-    
-    return vcs
-
-
-def populate_cache_from_results():
-    """Main function to populate cache from results directory"""
+    With workers > 1 files are parsed in that many processes; otherwise each file is parsed
+    when reached. A file's VCs are only yielded once the whole file parsed, so a bad file adds
+    nothing. page_number / vcs are None when unusable.
+    """
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(parse_result_file, file_paths)
+        return
+    
+    yield from map(parse_result_file, file_paths)
+
+
+def populate_cache_from_results(workers=1, verbose=False):
+    """
+    Main function to populate cache from results directory
+    
+    workers > 1 parses result files in parallel; verbose prints a line per VC (otherwise per file only)
+    """
     print("🔄 Populating VC Cache from Results Directory...")
     print("=" * 60)
     
@@ -77,6 +148,9 @@ def populate_cache_from_results():
     initial_stats = cache_manager.get_cache_stats()
     print(f"📊 Initial cache state: {initial_stats['total_vcs']} VCs")
     
+    # Slugs already in the cache - one set probe per VC below, kept up to date as VCs are added
+    known_slugs = set(cache_manager.cache_data)
+    
     # Get results directory path
     current_dir = os.path.dirname(os.path.abspath(__file__))
     results_dir = os.path.join(current_dir, "results")
@@ -92,78 +166,74 @@ def populate_cache_from_results():
     total_vcs_skipped = 0
     files_processed = 0
     
-    for filename in sorted(os.listdir(results_dir)):
-        if not filename.endswith('.json'):
-            continue
-            
-        # Only process completed files (skip in_progress)
-        if 'completed' not in filename:
-            print(f"⏩ Skipping non-completed file: {filename}")
-            continue
-            
+    # Only completed result files (in_progress pages are skipped), filtered while the directory is scanned
+    with os.scandir(results_dir) as it:
+        entries = [entry for entry in it
+                   if entry.name.endswith('.json') and _COMPLETED_IN in entry.name and entry.is_file()]
+    entries.sort(key=lambda entry: entry.name)
+    file_paths = [entry.path for entry in entries]
+    
+    # Files are parsed (in parallel with workers > 1) - the cache itself is only updated here
+    for filename, page_number, vcs in iter_parsed_result_files(file_paths, workers):
         print(f"\n📄 Processing: {filename}")
         
-        # Extract page number
-        page_number = extract_page_number_from_filename(filename)
         if page_number is None:
             print(f"⚠️  Could not extract page number from: {filename}")
             continue
             
         print(f"   📍 Page number: {page_number}")
         
-        # Load file
-        file_path = os.path.join(results_dir, filename)
-        results_data = load_result_file(file_path)
-        if results_data is None:
+        if vcs is None:
             continue
             
-        # Extract VC data
-        vcs = extract_vc_data_from_results(results_data, page_number, filename)
-        print(f"   🔍 Found {len(vcs)} VCs in file")
-        
-        # Add each VC to cache
-        file_added = 0
+        # Collect this file's new VCs
+        file_found = 0
         file_skipped = 0
+        new_vcs = []
         
         for vc in vcs:
+            file_found += 1
             slug = vc['slug']
             
-            # Check if already in cache
-            if cache_manager.get_vc_status(slug) is not None:
-                print(f"     ⏩ Already in cache: {slug}")
+            # Check if already in cache (or already collected from this file)
+            if slug in known_slugs:
+                if verbose:
+                    print(f"     ⏩ Already in cache: {slug}")
                 file_skipped += 1
                 continue
-                
-            # Add to cache
-            success = cache_manager.add_vc(
-                slug=slug,
-                name=vc['name'],
-                url=vc['url'],
-                first_seen_page=vc['page_number']
-            )
             
-            if success:
-                # Mark as completed with scraped timestamp
-                cache_manager.mark_vc_completed(slug)
-                
-                # Update last_scraped if we have the timestamp
-                if vc['scraped_at']:
-                    cache_manager.cache_data[slug]['last_scraped'] = vc['scraped_at']
-                    cache_manager.cache_data[slug]['last_updated'] = vc['scraped_at']
-                    cache_manager._save_cache()
-                
-                print(f"     ✅ Added: {slug} ({vc['name'][:30]}...)")
-                file_added += 1
-            else:
-                print(f"     ❌ Failed to add: {slug}")
-                file_skipped += 1
+            known_slugs.add(slug)
+            new_vcs.append({
+                'slug': slug,
+                'name': vc['name'],
+                'url': vc['url'],
+                'first_seen_page': vc['page_number'],
+                'scraped_at': vc['scraped_at']  # Scrape time of the completed entry (now if missing)
+            })
+        
+        # Add them all as completed in one batch
+        file_added = cache_manager.add_vcs(new_vcs, status="completed")
+        file_skipped += len(new_vcs) - file_added
+        if verbose:
+            for vc in new_vcs:
+                if vc['slug'] in cache_manager.cache_data:
+                    print(f"     ✅ Added: {vc['slug']} ({vc['name'][:30]}...)")
+                else:
+                    print(f"     ❌ Failed to add: {vc['slug']}")
+        
+        # Checkpoint once per file - the VCs above were only added in memory
+        cache_manager.flush()
         
         total_vcs_added += file_added
         total_vcs_skipped += file_skipped
         files_processed += 1
         
+        print(f"   🔍 Found {file_found} VCs in file")
         print(f"   📊 File summary: {file_added} added, {file_skipped} skipped")
     
+    # Make sure nothing is left unsaved (no-op if the last file was already checkpointed)
+    cache_manager.flush()
+    
     # Final summary
     print("\n" + "=" * 60)
     print("🎉 CACHE POPULATION COMPLETE")
@@ -182,4 +252,11 @@ def populate_cache_from_results():
 
 
 if __name__ == "__main__":
-    populate_cache_from_results()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Populate the VC cache from completed result files")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parse result files in this many processes (default: 1)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Print a line for every added/skipped VC (default: per-file summaries only)")
+    args = parser.parse_args()
+    
+    populate_cache_from_results(workers=args.workers, verbose=args.verbose)
\ No newline at end of file
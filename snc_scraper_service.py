@@ -24,13 +24,21 @@ from user_config import get_active_user_config, get_connection_type, get_scraper
     get_scraperapi_country, get_user_proxy, get_user_type, get_user_agent, print_user_info
 
 # Helper Module Imports (organized at top to avoid circular imports)
-from helpers.driver_factory import create_stealth_driver, USER_AGENTS
+from helpers.driver_factory import create_stealth_driver, open_new_tab, USER_AGENTS
+from helpers.background_writer import BackgroundWriter
+from helpers.json_utils import dumps_json, load_json
+from helpers.rate_limiter import TokenBucket
+from helpers.log_utils import get_logger, setup_logging
+from helpers.url_utils import vc_id_from_url
 from helpers.session_manager import SessionManager
 from helpers.page_orchestrator import PageOrchestrator
+from helpers.search_page_helper import get_scraped_vc_ids
 from helpers.vc_page_helper.vc_orchestrator import VCOrchestrator
 
 # Driver creation moved to helpers/driver_factory.py to avoid circular imports
 
+logger = get_logger(__name__)
+
 
 class SNCVCScraper:
     def __init__(self, verbose=False, proxy=None, user_agent_pool=None, use_config=True):
@@ -38,12 +46,11 @@ class SNCVCScraper:
         self.scraped_count = 0
         self.failed_urls = []
         self.results = []
-        self.scraped_vc_ids = set()  # Track scraped VC IDs to prevent duplicates
-        self.scraped_urls = set()  # Track scraped URLs to prevent duplicates
         self.rate_limit_detected = False  # Track if rate limit was hit
         self.current_page = 1  # Track current page for resume functionality
         self.current_page_vc_count = 0  # Track VCs processed on current page
         self.verbose = verbose  # Control debug print output
+        setup_logging(verbose)  # Queue-backed progress logging (DEBUG lines only when verbose)
 
         # User Configuration Integration with ScraperAPI support
         if use_config:
@@ -73,41 +80,56 @@ class SNCVCScraper:
         self.current_user_agent = user_agent_override  # Use config override if provided
         self.session_start_time = time.time()  # Track session duration
 
+        # Proactive request pacing - every VC page load takes a token (shared by all VCOrchestrators)
+        self.requests_per_second = 0.5
+        self.request_burst = 3
+        self.rate_limit_cooldown = 300  # Seconds to hold all requests after a detected rate limit
+        self.rate_limiter = TokenBucket(rate=self.requests_per_second, capacity=self.request_burst)
+
         # VC Status Tracking for resume functionality (OPTIMIZED)
         self.vc_status = {}  # Unified tracking: {"vc_id": {"status": "pending|in_progress|completed|failed", "url": url, "page": int, "attempts": 0}}
 
         # Simplified page tracking (OPTIMIZED - removed redundant page_status)
         self.completed_pages = set()  # Just track completed page numbers
         self.page_ownership = {}  # Track which user/browser owns which page: {page_num: {"user": str, "claimed_at": str, "status": str}}
+        self.page_index = {}  # In-memory page file index: {page_num: {"path": str, "status": str, "vcs": list, "metadata": dict}}
+        self._cache_manager = None  # VCCacheManager shared by cache filtering, loaded on first use
 
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")  # Unique session identifier
 
+        # Page/progress JSON is serialized here but written to disk on a background thread
+        self.writer = BackgroundWriter()
+
         self.setup_directories()
 
     def _verbose_print(self, message):
         """Print message only if verbose mode is enabled"""
         if self.verbose:
-            print(message)
+            logger.info(message)
 
     def _set_vc_status(self, vc_id, status, url=None, discovered_on_page=None):
         """Set status for a specific VC"""
-        if vc_id not in self.vc_status:
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        entry = self.vc_status.get(vc_id)
+        if entry is None:
             self.vc_status[vc_id] = {
                 "status": status,
                 "url": url or "",
                 "attempts": 0,
-                "first_seen": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "first_seen": now,
+                "last_updated": now,
                 "discovered_on_page": discovered_on_page or self.current_page
             }
         else:
-            self.vc_status[vc_id]["status"] = status
-            self.vc_status[vc_id]["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            entry["status"] = status
+            entry["last_updated"] = now
             if status == "in_progress":
-                self.vc_status[vc_id]["attempts"] += 1
+                entry["attempts"] += 1
+            if url and not entry["url"]:
+                entry["url"] = url
             # Update discovered_on_page if provided
             if discovered_on_page is not None:
-                self.vc_status[vc_id]["discovered_on_page"] = discovered_on_page
+                entry["discovered_on_page"] = discovered_on_page
 
     def _get_vc_status(self, vc_id):
         """Get status for a specific VC"""
@@ -189,15 +211,19 @@ class SNCVCScraper:
             with open(state_path, 'w') as f:
                 json.dump(state_data, f, indent=2)
 
-            print(f"💾 State saved: {state_filename}")
-            print(f"   📊 {len(self._get_completed_vcs())} completed, {len(self._get_pending_vcs())} pending VCs")
+            logger.info("💾 State saved: %s", state_filename)
+            logger.info("   📊 %s completed, %s pending VCs", len(self._get_completed_vcs()), len(self._get_pending_vcs()))
 
             return state_path
 
         except Exception as e:
-            print(f"❌ Error saving state: {e}")
+            logger.warning("❌ Error saving state: %s", e)
             return None
 
+    def reload_cache(self):
+        """Drop the shared VC cache manager so the next cache filter re-reads vc_cache.json"""
+        self._cache_manager = None
+
     def setup_directories(self):
         """Create simple directory structure for storing results"""
         # Create simple results directory
@@ -215,7 +241,7 @@ class SNCVCScraper:
         if not os.path.exists(self.final_dir):
             os.makedirs(self.final_dir)
 
-        print(f"📁 Using directories: {self.results_dir}/, {self.progress_dir}/, {self.final_dir}/")
+        logger.info("📁 Using directories: %s/, %s/, %s/", self.results_dir, self.progress_dir, self.final_dir)
 
     def _rotate_user_agent(self):
         """Phase 4: Rotate to a new user agent"""
@@ -237,7 +263,7 @@ class SNCVCScraper:
     def _get_scraperapi_session_proxy(self):
         """Get a session-based proxy from ScraperAPI (one IP for entire session)"""
         if not self.scraperapi_key:
-            print("❌ ScraperAPI key not configured")
+            logger.warning("❌ ScraperAPI key not configured")
             return None
 
         try:
@@ -255,18 +281,18 @@ class SNCVCScraper:
                 # For ScraperAPI, we use their proxy endpoint format
                 session_proxy = f"http://{self.scraperapi_key}:@proxy-server.scraperapi.com:8001"
 
-                print(f"✅ ScraperAPI session proxy obtained for {self.scraperapi_country}")
-                print(f"   🌍 Country: {self.scraperapi_country}")
-                print(f"   📡 Session-based IP (same for entire browser session)")
+                logger.info("✅ ScraperAPI session proxy obtained for %s", self.scraperapi_country)
+                logger.info("   🌍 Country: %s", self.scraperapi_country)
+                logger.info("   📡 Session-based IP (same for entire browser session)")
 
                 return session_proxy
             else:
-                print(f"❌ ScraperAPI error: {response.status_code}")
-                print(f"   Response: {response.text}")
+                logger.warning("❌ ScraperAPI error: %s", response.status_code)
+                logger.info("   Response: %s", response.text)
                 return None
 
         except Exception as e:
-            print(f"❌ Error getting ScraperAPI session proxy: {e}")
+            logger.warning("❌ Error getting ScraperAPI session proxy: %s", e)
             return None
 
     # Session management methods moved to helpers/session_manager.py
@@ -281,14 +307,14 @@ class SNCVCScraper:
             # First, check HTTP status code through browser logs or page title
             page_title = self.driver.title.lower()
             if "429" in page_title or "rate limit" in page_title or "too many requests" in page_title:
-                print(f"🚨 RATE LIMIT DETECTED: HTTP 429 in page title - '{self.driver.title}'")
+                logger.warning("🚨 RATE LIMIT DETECTED: HTTP 429 in page title - '%s'", self.driver.title)
                 self.rate_limit_detected = True
                 return True
 
             # Check current URL for error indicators
             current_url = self.driver.current_url
             if "error" in current_url.lower() or "429" in current_url:
-                print(f"🚨 RATE LIMIT DETECTED: Error in URL - {current_url}")
+                logger.warning("🚨 RATE LIMIT DETECTED: Error in URL - %s", current_url)
                 self.rate_limit_detected = True
                 return True
 
@@ -318,8 +344,8 @@ class SNCVCScraper:
                         # Check if element is visible
                         visible_elements = [elem for elem in elements if elem.is_displayed()]
                         if visible_elements:
-                            print(f"🚨 RATE LIMIT DETECTED: Found visible indicator - {indicator}")
-                            print(f"   Text: {visible_elements[0].text[:100]}")
+                            logger.warning("🚨 RATE LIMIT DETECTED: Found visible indicator - %s", indicator)
+                            logger.info("   Text: %s", visible_elements[0].text[:100])
                             self.rate_limit_detected = True
                             return True
                 except Exception:
@@ -335,7 +361,7 @@ class SNCVCScraper:
 
             for pattern in rate_limit_patterns:
                 if pattern in page_source:
-                    print(f"🚨 RATE LIMIT DETECTED: Found pattern '{pattern}' in page source")
+                    logger.warning("🚨 RATE LIMIT DETECTED: Found pattern '%s' in page source", pattern)
                     self.rate_limit_detected = True
                     return True
 
@@ -348,10 +374,10 @@ class SNCVCScraper:
                 pass
 
             if len(body_text) < 100:  # Very short page content
-                print(f"⚠️  Possible rate limit: Very short page content ({len(body_text)} chars)")
+                logger.warning("⚠️  Possible rate limit: Very short page content (%s chars)", len(body_text))
                 # Don't automatically mark as rate limit, but warn
                 if len(body_text) < 20:  # Almost empty page
-                    print(f"🚨 RATE LIMIT DETECTED: Nearly empty page (likely blocked)")
+                    logger.warning("🚨 RATE LIMIT DETECTED: Nearly empty page (likely blocked)")
                     self.rate_limit_detected = True
                     return True
 
@@ -375,7 +401,7 @@ class SNCVCScraper:
                 return False
 
         except Exception as e:
-            print(f"⚠️  Error in rate limit detection: {e}")
+            logger.warning("⚠️  Error in rate limit detection: %s", e)
             return False
 
     def extract_data_safely(self, xpath_list, default="N/A"):
@@ -406,59 +432,56 @@ class SNCVCScraper:
         if not vc_urls:
             return []
 
-        print(f"🔄 Processing {len(vc_urls)} VCs in batches of max {max_tabs} tabs...")
+        logger.info("🔄 Processing %s VCs in batches of max %s tabs...", len(vc_urls), max_tabs)
         original_window = self.driver.current_window_handle
         all_results = []
 
+        # One session manager / orchestrator for the whole run (both only hold a scraper reference)
+        session_manager = SessionManager(self)
+        vc_page_helper = VCOrchestrator(self)
+
         # Process VCs in batches of max_tabs
         for batch_start in range(0, len(vc_urls), max_tabs):
             batch_urls = vc_urls[batch_start:batch_start + max_tabs]
             batch_num = (batch_start // max_tabs) + 1
             total_batches = (len(vc_urls) + max_tabs - 1) // max_tabs
 
-            print(f"\n📦 Batch {batch_num}/{total_batches}: Processing {len(batch_urls)} VCs")
+            logger.info("\n📦 Batch %s/%s: Processing %s VCs", batch_num, total_batches, len(batch_urls))
 
             # Step 1: Open all tabs in batch (human-like timing)
             opened_windows = []
             for i, url in enumerate(batch_urls):
                 try:
-                    print(f"  🖱️  Opening tab {i + 1}/{len(batch_urls)}: {url.split('/')[-1]}")
+                    logger.info("  🖱️  Opening tab %s/%s: %s", i + 1, len(batch_urls), vc_id_from_url(url))
 
                     # Skip mouse movement for speed (only every 3rd tab)
                     if i % 3 == 0:
-                        # Use session manager for human behavior
-                        session_manager = SessionManager(self)
                         session_manager.human_mouse_move()
 
-                    # Open new tab
-                    self.driver.execute_script(f"window.open('{url}', '_blank');")
-
-                    # Track the new window
-                    all_windows = self.driver.window_handles
-                    new_window = [w for w in all_windows if w != original_window and w not in opened_windows][0]
-                    opened_windows.append(new_window)
+                    # Open new tab (in the same browser) and track its handle - every tab is a page load,
+                    # so it is paced by the token bucket before the site can rate-limit us
+                    self.rate_limiter.acquire()
+                    opened_windows.append(open_new_tab(self.driver, url))
 
                     # Human-like delay between tab opens
                     time.sleep(random.uniform(0.8, 1.5))  # Restored proper delay
 
                 except Exception as e:
-                    print(f"  ❌ Error opening tab for {url}: {e}")
+                    logger.warning("  ❌ Error opening tab for %s: %s", url, e)
                     continue
 
-            print(f"  📱 Opened {len(opened_windows)} tabs, now processing...")
+            logger.info("  📱 Opened %s tabs, now processing...", len(opened_windows))
 
             # Step 2: Process all tabs in parallel (switch between them)
             batch_results = []
             for i, (url, window_handle) in enumerate(zip(batch_urls, opened_windows)):
                 try:
-                    print(f"  📊 Processing tab {i + 1}/{len(opened_windows)}: {url.split('/')[-1]}")
+                    logger.info("  📊 Processing tab %s/%s: %s", i + 1, len(opened_windows), vc_id_from_url(url))
 
                     # Switch to tab
                     self.driver.switch_to.window(window_handle)
 
                     # Add mouse movement after switching
-                    # Use session manager for human behavior
-                    session_manager = SessionManager(self)
                     session_manager.human_mouse_move()
 
                     # Wait for page load and scrape
@@ -468,50 +491,47 @@ class SNCVCScraper:
                         )
 
                         current_url = self.driver.current_url
-                        print(f"    🔍 Original URL: {url}")
-                        print(f"    🔍 Current URL:  {current_url}")
+                        logger.info("    🔍 Original URL: %s", url)
+                        logger.info("    🔍 Current URL:  %s", current_url)
 
                         # Scrape complete data: Overview + Investments (use original URL to avoid redirect issues)
-                        vc_page_helper = VCOrchestrator(self)
                         complete_data = vc_page_helper.scrape_investor_complete_with_investments(url)
                         if complete_data:
                             batch_results.append(complete_data)
                             all_results.append(complete_data)  # Add to total results immediately
-                            print(f"    ✅ Completed: {complete_data['name']}")
+                            logger.info("    ✅ Completed: %s", complete_data['name'])
                             
                             # Progressive saving after each VC completion
                             if page_num is not None:
                                 try:
                                     self.save_page_progress(all_results, page_num)
-                                    print(f"    💾 Saved progress: {len(all_results)} VCs completed")
+                                    logger.info("    💾 Saved progress: %s VCs completed", len(all_results))
                                 except Exception as e:
-                                    print(f"    ⚠️  Error saving progress: {e}")
+                                    logger.warning("    ⚠️  Error saving progress: %s", e)
                         else:
-                            print(f"    ❌ Failed to scrape: {current_url.split('/')[-1]}")
+                            logger.warning("    ❌ Failed to scrape: %s", vc_id_from_url(current_url))
                             # Check if this failure was due to rate limit
                             if self.rate_limit_detected:
-                                print(f"    🚨 Rate limit detected during scraping - breaking from batch")
+                                logger.warning("    🚨 Rate limit detected during scraping - breaking from batch")
                                 break
                     except Exception as e:
-                        print(f"    ❌ Error scraping tab: {e}")
+                        logger.warning("    ❌ Error scraping tab: %s", e)
 
                     # Human-like delay between processing tabs
                     time.sleep(random.uniform(2.0, 4.0))  # Restored proper delay
 
                 except Exception as e:
-                    print(f"  ❌ Error processing tab {i + 1}: {e}")
+                    logger.warning("  ❌ Error processing tab %s: %s", i + 1, e)
                     continue
 
             # Step 3: Close all tabs in batch (human-like)
-            print(f"  🗑️  Closing {len(opened_windows)} tabs...")
+            logger.info("  🗑️  Closing %s tabs...", len(opened_windows))
             for i, window_handle in enumerate(opened_windows):
                 try:
                     self.driver.switch_to.window(window_handle)
 
                     # Human-like mouse movement for closing
                     if i % 2 == 0:  # Every other tab for realism
-                        # Use session manager for human behavior
-                        session_manager = SessionManager(self)
                         session_manager.human_mouse_move()
 
                     # Close tab
@@ -521,30 +541,28 @@ class SNCVCScraper:
                     time.sleep(random.uniform(1.0, 2.0))  # Restored proper delay
 
                 except Exception as e:
-                    print(f"    ⚠️  Error closing tab {i + 1}: {e}")
+                    logger.warning("    ⚠️  Error closing tab %s: %s", i + 1, e)
                     continue
 
             # Return to search page
             self.driver.switch_to.window(original_window)
 
             # Results already added immediately after each VC completion for progressive saving
-            print(f"  📊 Batch {batch_num} completed: {len(batch_results)}/{len(batch_urls)} successful")
+            logger.info("  📊 Batch %s completed: %s/%s successful", batch_num, len(batch_results), len(batch_urls))
 
             # Faster delay between batches
             if batch_start + max_tabs < len(vc_urls):  # Not the last batch
                 delay = random.uniform(1.0, 2.5)  # Reduced from 2.0-4.0s
-                print(f"  ⏳ Resting {delay:.1f}s before next batch...")
+                logger.info("  ⏳ Resting %.1fs before next batch...", delay)
                 time.sleep(delay)
 
-        print(f"✅ All batches completed: {len(all_results)}/{len(vc_urls)} successful")
+        logger.info("✅ All batches completed: %s/%s successful", len(all_results), len(vc_urls))
         return all_results
 
 
     def save_page_progress(self, page_results, page_num):
         """Save progress after each page completion with CORRECT page number in filename"""
         try:
-            import pandas as pd
-
             # Generate timestamp for filenames (YYYYMMDD_HHMMSS format)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -567,27 +585,24 @@ class SNCVCScraper:
                 "vcs": page_results
             }
 
-            # Save JSON for this page
-            with open(page_path, 'w') as f:
-                json.dump(page_data, f, indent=2)
+            # Save JSON for this page (written in the background)
+            self.writer.save(page_path, dumps_json(page_data))
 
             # Mark page as completed and release ownership
             self.completed_pages.add(page_num)
             # Page completed (user coordination removed)
 
-            print(f"📏 Page {page_num} completed and saved: {page_filename_json}")
-            print(f"   📄 {len(page_results)} VCs from ACTUAL page {page_num}")
-            print(f"   💼 User: {self.user_type}")
-            print(f"   📁 Location: {self.progress_dir}")
+            logger.info("📏 Page %s completed and saved: %s", page_num, page_filename_json)
+            logger.info("   📄 %s VCs from ACTUAL page %s", len(page_results), page_num)
+            logger.info("   💼 User: %s", self.user_type)
+            logger.info("   📁 Location: %s", self.progress_dir)
 
         except Exception as e:
-            print(f"❌ Error saving page progress: {e}")
+            logger.warning("❌ Error saving page progress: %s", e)
 
     def save_page_progress_with_rate_limit(self, page_results, page_num, vcs_processed, total_vcs_on_page):
         """Save partial page progress when rate limit is hit"""
         try:
-            import pandas as pd
-
             # Generate timestamp for filenames (YYYYMMDD_HHMMSS format)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -614,17 +629,20 @@ class SNCVCScraper:
                 "vcs": page_results
             }
 
-            # Save JSON for this partial page
-            with open(page_path, 'w') as f:
-                json.dump(page_data, f, indent=2)
+            # Save JSON for this partial page - the session stops here, so wait for it to land
+            failed = []
+            self.writer.save(page_path, dumps_json(page_data), on_error=failed.append)
+            self.writer.flush()
+            if failed:
+                raise failed[0]
 
-            print(f"💾 PARTIAL page {page_num} saved: {page_filename_json}")
-            print(f"   📊 {len(page_results)} VCs scraped before rate limit")
-            print(f"   ⚠️ {total_vcs_on_page - vcs_processed} VCs remaining on page {page_num}")
-            print(f"   📁 Location: {self.progress_dir}")
+            logger.info("💾 PARTIAL page %s saved: %s", page_num, page_filename_json)
+            logger.info("   📊 %s VCs scraped before rate limit", len(page_results))
+            logger.warning("   ⚠️ %s VCs remaining on page %s", total_vcs_on_page - vcs_processed, page_num)
+            logger.info("   📁 Location: %s", self.progress_dir)
 
         except Exception as e:
-            print(f"❌ Error saving partial page progress: {e}")
+            logger.warning("❌ Error saving partial page progress: %s", e)
 
     def save_final_results(self, results, test_name="final"):
         """Save final results to organized directories"""
@@ -634,15 +652,18 @@ class SNCVCScraper:
             final_filename = f'vc_investors_{test_name}_{len(results)}_vcs_{timestamp}.json'
             final_path = os.path.join(self.final_dir, final_filename)
 
-            # Save final JSON results
-            with open(final_path, 'w') as f:
-                json.dump(results, f, indent=2)
+            # Save final JSON results - flushed so the returned path is only reported once it exists
+            failed = []
+            self.writer.save(final_path, dumps_json(results), on_error=failed.append)
+            self.writer.flush()
+            if failed:
+                raise failed[0]
 
-            print(f"💾 Final results saved: {final_path}")
+            logger.info("💾 Final results saved: %s", final_path)
             return final_path
 
         except Exception as e:
-            print(f"❌ Error saving final results: {e}")
+            logger.warning("❌ Error saving final results: %s", e)
             return None
 
     # ======================================================
@@ -655,14 +676,12 @@ class SNCVCScraper:
         Saves in format: page_3_completed_7_vcs_142301.json
         """
         try:
-            # Ensure results directory exists
-            if not os.path.exists("results"):
-                os.makedirs("results")
-
+            # results/ is created once by setup_directories() - no per-save existence check
             timestamp = datetime.now().strftime("%H%M%S")
 
             # Remove old files with same page and different status if completing
             if status == "completed":
+                self.writer.flush()  # Queued in_progress writes must land before they are removed
                 self._remove_old_page_files(page_num, ["in_progress", "partial"])
 
             # Create structured filename
@@ -680,7 +699,8 @@ class SNCVCScraper:
                     "session_id": self.session_id,
                     "user_type": self.user_type,
                     "connection_type": self.connection_type,
-                    "scraper_version": "enhanced_old_version"
+                    "scraper_version": "enhanced_old_version",
+                    "scraped_vc_ids": sorted(get_scraped_vc_ids(vcs))  # Lets resume skip re-deriving per-VC status
                 },
                 "vcs": vcs
             }
@@ -689,15 +709,17 @@ class SNCVCScraper:
             if additional_metadata:
                 page_data["metadata"].update(additional_metadata)
 
-            # Save structured JSON
-            with open(filepath, 'w') as f:
-                json.dump(page_data, f, indent=2)
+            # Save structured JSON (written in the background) - the page is only indexed once
+            # its file is on disk; until then lookups flush the writer and read results/
+            self.page_index.pop(page_num, None)
+            entry = {"path": filepath, "status": status, "vcs": vcs, "metadata": page_data["metadata"]}
+            self.writer.save(filepath, dumps_json(page_data), on_written=lambda: self.page_index.__setitem__(page_num, entry))
 
-            print(f"💾 Enhanced page save: {filename}")
+            logger.info("💾 Enhanced page save: %s", filename)
             return filename
 
         except Exception as e:
-            print(f"❌ Error saving enhanced page data: {e}")
+            logger.warning("❌ Error saving enhanced page data: %s", e)
             return None
 
     def _remove_old_page_files(self, page_num, status_list):
@@ -712,10 +734,10 @@ class SNCVCScraper:
                         if f'_{status}_' in filename:
                             filepath = os.path.join(self.results_dir, filename)
                             os.remove(filepath)
-                            print(f"🗑️ Removed old file: {filename}")
+                            logger.info("🗑️ Removed old file: %s", filename)
                             break
         except Exception as e:
-            print(f"⚠️ Error removing old files: {e}")
+            logger.warning("⚠️ Error removing old files: %s", e)
 
     def load_page_with_enhanced_metadata(self, page_num):
         """
@@ -723,34 +745,43 @@ class SNCVCScraper:
         Returns: (vcs_list, status, metadata) or ([], None, None)
         """
         try:
+            indexed = self.page_index.get(page_num)
+            if indexed is not None:
+                return indexed["vcs"], indexed["status"], indexed["metadata"]
+
+            # Make sure queued page writes are visible before looking for them
+            self.writer.flush()
+
             if not os.path.exists(self.results_dir):
                 return [], None, None
 
             # Find page file
-            for filename in os.listdir(self.results_dir):
-                if filename.startswith(f'page_{page_num}_') and filename.endswith('.json'):
-                    filepath = os.path.join(self.results_dir, filename)
-
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-
-                    # Handle both old and new formats
-                    if isinstance(data, dict) and "metadata" in data and "vcs" in data:
-                        # New enhanced format
-                        return data["vcs"], data["metadata"]["status"], data["metadata"]
-                    elif isinstance(data, dict) and "vcs" in data:
-                        # Old format with some metadata
-                        status = data.get("metadata", {}).get("status", "unknown")
-                        return data["vcs"], status, data.get("metadata", {})
-                    else:
-                        # Legacy format - direct VC list
-                        status = "completed" if "completed" in filename else "in_progress"
-                        return data, status, {}
+            with os.scandir(self.results_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if filename.startswith(f'page_{page_num}_') and filename.endswith('.json'):
+                        data = load_json(entry.path)
+
+                        # Handle both old and new formats
+                        if isinstance(data, dict) and "metadata" in data and "vcs" in data:
+                            # New enhanced format
+                            vcs, status, metadata = data["vcs"], data["metadata"]["status"], data["metadata"]
+                        elif isinstance(data, dict) and "vcs" in data:
+                            # Old format with some metadata
+                            status = data.get("metadata", {}).get("status", "unknown")
+                            vcs, metadata = data["vcs"], data.get("metadata", {})
+                        else:
+                            # Legacy format - direct VC list
+                            status = "completed" if "completed" in filename else "in_progress"
+                            vcs, metadata = data, {}
+
+                        self.page_index[page_num] = {"path": entry.path, "status": status, "vcs": vcs, "metadata": metadata}
+                        return vcs, status, metadata
 
             return [], None, None
 
         except Exception as e:
-            print(f"❌ Error loading page data: {e}")
+            logger.warning("❌ Error loading page data: %s", e)
             return [], None, None
 
     def print_status_summary(self):
@@ -760,27 +791,30 @@ class SNCVCScraper:
         failed = len([vc_id for vc_id, data in self.vc_status.items() if data["status"] == "failed"])
         in_progress = len([vc_id for vc_id, data in self.vc_status.items() if data["status"] == "in_progress"])
 
-        print(f"\n📊 === SESSION STATUS SUMMARY ===")
-        print(f"✅ Completed VCs: {completed}")
-        print(f"⏳ Pending VCs: {pending}")
-        print(f"❌ Failed VCs: {failed}")
-        print(f"🔄 In Progress VCs: {in_progress}")
-        print(f"📈 Total VCs tracked: {len(self.vc_status)}")
-        print(f"🆔 Session ID: {self.session_id}")
+        logger.info("\n📊 === SESSION STATUS SUMMARY ===")
+        logger.info("✅ Completed VCs: %s", completed)
+        logger.info("⏳ Pending VCs: %s", pending)
+        logger.warning("❌ Failed VCs: %s", failed)
+        logger.info("🔄 In Progress VCs: %s", in_progress)
+        logger.info("📈 Total VCs tracked: %s", len(self.vc_status))
+        logger.info("🆔 Session ID: %s", self.session_id)
         if self.rate_limit_detected:
-            print(f"🚨 Rate limit detected: YES")
-        print(f"📊 ==================================")
+            logger.warning("🚨 Rate limit detected: YES")
+        logger.info("📊 ==================================")
 
     def close_session(self):
+        write_error = self.writer.close()  # Finish pending page writes
+        if write_error is not None:
+            logger.warning("❌ Last background write failed: %s", write_error)
         if self.driver:
             self.driver.quit()
-            print("🔒 Browser session closed")
+            logger.info("🔒 Browser session closed")
 
 
 def run_single_page_session():
     """Run a single page session with proper coordination and page claiming"""
-    print("🎯 SNC SCRAPER - SINGLE PAGE SESSION")
-    print("=" * 50)
+    logger.info("🎯 SNC SCRAPER - SINGLE PAGE SESSION")
+    logger.info("=" * 50)
 
     # Create scraper with user configuration
     scraper = SNCVCScraper(verbose=True, use_config=True)
@@ -792,12 +826,12 @@ def run_single_page_session():
 
     try:
 
-        print("\n1️⃣ Starting session and login...")
+        logger.info("\n1️⃣ Starting session and login...")
         session_manager.start_session()
 
         # Load previous state and get target page
         target_page = state_manager.load_previous_state()
-        print(f"\n🎯 Target page: {target_page}")
+        logger.info("\n🎯 Target page: %s", target_page)
 
         # Process exactly one page using PageOrchestrator
         results, last_page = page_orchestrator.scrape_pages(
@@ -807,25 +841,25 @@ def run_single_page_session():
         )
 
         if results:
-            print(f"\n🎉 Successfully completed page {last_page}!")
+            logger.info("\n🎉 Successfully completed page %s!", last_page)
             scraper.save_final_results(results, f"page_{last_page}_user_{scraper.user_type}")
             scraper.print_status_summary()
         else:
-            print(f"\n⚠️  No results from page {target_page}")
+            logger.warning("\n⚠️  No results from page %s", target_page)
             scraper.print_status_summary()
 
-        print(f"\n✅ SESSION COMPLETE - Page {target_page} processed")
-        print("💡 Next steps:")
-        print("   1. Switch ACTIVE_USER in user_config.py")
-        print("   2. Run this script again for different pages")
-        print("   3. Or run same user again for next assigned page")
+        logger.info("\n✅ SESSION COMPLETE - Page %s processed", target_page)
+        logger.info("💡 Next steps:")
+        logger.info("   1. Switch ACTIVE_USER in user_config.py")
+        logger.info("   2. Run this script again for different pages")
+        logger.info("   3. Or run same user again for next assigned page")
 
     except KeyboardInterrupt:
-        print("\n⏹️  Session interrupted - saving state...")
+        logger.info("\n⏹️  Session interrupted - saving state...")
         scraper.save_current_state()
 
     except Exception as e:
-        print(f"❌ Error during session: {e}")
+        logger.warning("❌ Error during session: %s", e)
         scraper.save_current_state()
 
     finally:
@@ -834,8 +868,8 @@ def run_single_page_session():
 
 if __name__ == "__main__":
     # Enhanced main execution with new features
-    print("🎯 SNC SCRAPER")
-    print("=" * 40)
-    print()
+    logger.info("🎯 SNC SCRAPER")
+    logger.info("=" * 40)
+    logger.info("")
 
     run_single_page_session()
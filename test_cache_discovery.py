@@ -44,9 +44,8 @@ def test_cache_discovery_functionality():
             print(f"   ✅ Status check works: {status}")
             
             # Clean up test VC
-            if test_slug in cache_manager.cache_data:
-                del cache_manager.cache_data[test_slug]
-                cache_manager._save_cache()
+            if cache_manager.remove_vc(test_slug):
+                cache_manager.flush()
                 print(f"   🧹 Cleaned up test VC")
         else:
             print(f"   ❌ Failed to add test VC")
@@ -65,9 +65,8 @@ def test_step3_complete_integration():
         print(f"   ✅ Cache operations work: {status == 'pending'}")
         
         # Cleanup
-        if test_slug in cache_manager.cache_data:
-            del cache_manager.cache_data[test_slug]
-            cache_manager._save_cache()
+        if cache_manager.remove_vc(test_slug):
+            cache_manager.flush()
         
     except Exception as e:
         print(f"   ❌ Cache system error: {e}")